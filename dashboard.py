@@ -4,21 +4,33 @@
 # - CVMA (Economic Impact 2024 Update, 2023-24) : https://www.canadianveterinarians.net/media/jo4hqvwc/cvma_final-report-en.pdf
 # - OMVQ (Portrait démographique au 26 septembre 2024) : https://www.omvq.qc.ca/DATA/TEXTEDOC/2024---Portrait-de-la-profession-veterinaire---Document.pdf
 
+import json
+import os
+
 import streamlit as st
-import pandas as pd
-import plotly.express as px
+
+from linkinvet import perf, warmup
+from linkinvet.warmup import prewarm_imports
+
+# Démarrage à froid : plotly / pandas / pyarrow se chargent dans un thread de fond (une fois par processus)
+# pendant que l'en-tête s'affiche ; les modules qui en dépendent sont importés après la configuration.
+prewarm_imports()
+
+# Instrumentation : temps par section (linkinvet/perf.py), visibles dans le panneau admin (?admin=...)
+perf.start_run()
 
 # -----------------------------
 # Configuration
 # -----------------------------
-st.set_page_config(
-    page_title="LinkinVet — Marché vétérinaire (Canada/Québec)",
-    layout="wide",
-)
-
-st.title("LinkinVet — Marché vétérinaire (Canada/Québec)")
-st.markdown(
-    """
+with perf.section("configuration"):
+    st.set_page_config(
+        page_title="LinkinVet — Marché vétérinaire (Canada/Québec)",
+        layout="wide",
+    )
+
+    st.title("LinkinVet — Marché vétérinaire (Canada/Québec)")
+    st.markdown(
+        """
 Ce tableau de bord présente des **indicateurs de marché** basés sur des **sources publiques officielles**.
 Les éléments affichés suivent trois niveaux :
 
@@ -28,136 +40,150 @@ Les éléments affichés suivent trois niveaux :
 
 L’objectif est de fournir une vue synthétique et vérifiable, utilisable en contexte de **présentation à des partenaires financiers**.
 """
-)
+    )
 
 # -----------------------------
-# Données officielles — CVMA (Canada) — Economic Impact 2024 Update (2023-24)
+# Imports lourds (après le premier affichage)
 # -----------------------------
-# Officiel (CVMA PDF) :
-CAN_REGISTERED_VETS_2024 = 16317  # "registered veterinarians"
-CAN_ACTIVE_VETS_2023_24 = 15278   # "actively-practicing veterinarians"
-CAN_ACCREDITED_FACILITIES_2023_24 = 4328  # "accredited facilities"
-
-# Officiel (CVMA PDF, Table 1 — Canada, 2023-24) :
-CAN_OUTPUT_MCAD = 16946.8
-CAN_GDP_MCAD = 9549.3
-CAN_EMPLOYMENT_FTE = 81920
-CAN_TAX_FED_MCAD = 873.1
-CAN_TAX_PROV_MCAD = 797.3
-CAN_TAX_MUNI_MCAD = 158.2
-CAN_OUTPUT_DIRECT_MCAD = 10044.5
-CAN_GDP_DIRECT_MCAD = 5567.6
-CAN_EMPLOYMENT_DIRECT_FTE = 51660
-
-# Officiel (CVMA PDF, Figure 1 — Actively practicing veterinarians by province, 2023-24)
-# Provinces/territories: ON QC AB BC SK NS MB NB PE NL YK NT
-# Valeurs 2023-24 explicitement indiquées dans la figure.
-vets_active_2023_24 = {
-    "Ontario (ON)": 5386,
-    "Québec (QC)": 3212,
-    "Alberta (AB)": 2099,
-    "Colombie-Britannique (BC)": 2141,
-    "Saskatchewan (SK)": 724,
-    "Nouvelle-Écosse (NS)": 495,
-    "Manitoba (MB)": 458,
-    "Nouveau-Brunswick (NB)": 167,
-    "Île-du-Prince-Édouard (PE)": 238,
-    "Terre-Neuve-et-Labrador (NL)": 158,
-    "Yukon (YK)": 34,
-    "Territoires du Nord-Ouest (NT)": 4,
-}
-
-# Officiel (CVMA PDF, Figure 2 — Accredited veterinary practice facilities by province, 2023-24)
-# Note CVMA: changement de modèle d'accréditation en Ontario en 2023 (comparabilité 2022-23 limitée pour ON).
-facilities_2023_24 = {
-    "Ontario (ON)": 1760,
-    "Québec (QC)": 942,
-    "Alberta (AB)": 608,
-    "Colombie-Britannique (BC)": 688,
-    "Saskatchewan (SK)": 135,
-    "Nouvelle-Écosse (NS)": 155,
-    "Manitoba (MB)": 152,
-    "Nouveau-Brunswick (NB)": 92,
-    "Île-du-Prince-Édouard (PE)": 25,
-    "Terre-Neuve-et-Labrador (NL)": 31,
-    "Yukon (YK)": 14,
-    "Territoires du Nord-Ouest (NT)": 4,
-}
-
-df_ca = pd.DataFrame(
-    [{"Juridiction": k, "Vétérinaires actifs (2023-24)": v} for k, v in vets_active_2023_24.items()]
-).merge(
-    pd.DataFrame([{"Juridiction": k, "Établissements accrédités (2023-24)": v} for k, v in facilities_2023_24.items()]),
-    on="Juridiction",
-    how="left",
-)
+with perf.section("imports"):
+    import numpy as np
+
+    from linkinvet import access, data, figures, workforce
+    from linkinvet.data import (
+        VETS_COLUMN,
+        dataset_version,
+        derived,
+        fact,
+        get_cvma_timeseries,
+        get_df_ca,
+        get_qc_practice_main,
+        get_qc_regions,
+        jurisdiction_labels,
+    )
+    from linkinvet.figures import get_figure, histogram_figure, projection_figure, tornado_figure
+    from linkinvet.impact import MEASURES, evaluate, impact_table, shock_matrix
+    from linkinvet.scenario import (
+        DEFAULT_JURIS,
+        DEFAULT_SENSITIVITY_PCT,
+        DEFAULT_SOLO_SHARE,
+        MC_DEFAULT_DRAWS,
+        MC_DEFAULT_SOLO_SHARE,
+        MC_DEFAULT_VETS_PER_SOLO,
+        MC_DRAW_OPTIONS,
+        MC_OUTPUTS,
+        SENSITIVITY_OUTPUTS,
+        SOLO_SHARE_GRID,
+        Distribution,
+        monte_carlo,
+        scenario_grid,
+        scenario_point,
+        sensitivity,
+    )
 
-# Indicateur dérivé (calcul transparent)
-df_ca["Ratio (vétos / établissement) — indicateur dérivé"] = (
-    df_ca["Vétérinaires actifs (2023-24)"] / df_ca["Établissements accrédités (2023-24)"]
-)
+# -----------------------------
+# Données officielles — CVMA (Canada) / OMVQ (Québec)
+# -----------------------------
+# Chiffres sources : table de faits data/facts/*.csv (linkinvet/dataset.py). Les tableaux sont construits
+# une seule fois par processus (linkinvet/data.py) et partagés en lecture seule entre les sessions.
+with perf.section("données CVMA"):
+    # Officiel (CVMA PDF) :
+    CAN_REGISTERED_VETS_2024 = fact("vets_registered", "CA", "2024")
+    CAN_ACTIVE_VETS_2023_24 = fact("vets_active", "CA", "2023-24")
+    CAN_ACCREDITED_FACILITIES_2023_24 = fact("facilities_accredited", "CA", "2023-24")
+
+    # Officiel (CVMA PDF, Table 1 — Canada, 2023-24) :
+    CAN_OUTPUT_MCAD = fact("output_total_mcad", "CA", "2023-24")
+    CAN_GDP_MCAD = fact("gdp_total_mcad", "CA", "2023-24")
+    CAN_EMPLOYMENT_FTE = fact("employment_total_fte", "CA", "2023-24")
+    CAN_TAX_FED_MCAD = fact("tax_federal_mcad", "CA", "2023-24")
+    CAN_TAX_PROV_MCAD = fact("tax_provincial_mcad", "CA", "2023-24")
+    CAN_TAX_MUNI_MCAD = fact("tax_municipal_mcad", "CA", "2023-24")
+
+    # Officiel (CVMA PDF, Figures 1–2) : tableau provincial + ratio dérivé
+    df_ca = get_df_ca()
+
+with perf.section("données OMVQ"):
+    # Officiel (OMVQ — Portrait au 26 septembre 2024)
+    QC_OMVQ_MEMBERS_TOTAL = fact("members_total", "QC")
+    QC_OMVQ_ACTIVE_STATUS_N = fact("members_active_status", "QC")
+    QC_OMVQ_FEMALE_N = fact("members_female", "QC")
+    QC_OMVQ_MALE_N = fact("members_male", "QC")
+
+    # Officiel (OMVQ — constats pour animaux de compagnie)
+    QC_COMPANION_MONTÉRÉGIE_N = fact("companion_by_region/Montérégie", "QC")
+    QC_COMPANION_MONTRÉAL_N = fact("companion_by_region/Montréal", "QC")
+    QC_COMPANION_ABITIBI_N = fact("companion_by_region/Abitibi-Témiscamingue", "QC")
+    QC_COMPANION_GASPÉSIE_N = fact("companion_by_region/Gaspésie–Îles-de-la-Madeleine", "QC")
+    QC_COMPANION_CÔTE_NORD_N = fact("companion_by_region/Côte-Nord", "QC")
+    QC_COMPANION_NORD_DU_QC_N = fact("companion_by_region/Nord-du-Québec", "QC")
 
 # -----------------------------
-# Données officielles — OMVQ (Québec) — Portrait au 26 septembre 2024
+# Valeurs des widgets conservées entre les vues
 # -----------------------------
-QC_OMVQ_MEMBERS_TOTAL = 2804  # "membres actifs en sol québécois" (OMVQ)
-QC_OMVQ_ACTIVE_STATUS_N = 2381  # "statut actif (85%; n=2 381)" (OMVQ)
-QC_OMVQ_FEMALE_N = 2025         # "Féminin 72%; n=2 025" (OMVQ)
-QC_OMVQ_MALE_N = 779            # "Masculin 28%; n=779" (OMVQ)
-
-# Officiel (OMVQ — Pratique principale, base: membres OMVQ)
-# "Base: les médecins vétérinaires membres de l’OMVQ" : 1 674, 305, 172, ...
-qc_practice_main = pd.DataFrame([
-    {"Pratique principale": "Animaux de compagnie", "Effectif": 1674},
-    {"Pratique principale": "Grands animaux", "Effectif": 305},
-    {"Pratique principale": "Santé publique", "Effectif": 172},
-    {"Pratique principale": "Services-conseils", "Effectif": 149},
-    {"Pratique principale": "Équins", "Effectif": 94},
-    {"Pratique principale": "Enseignement", "Effectif": 95},
-    {"Pratique principale": "Administration", "Effectif": 76},
-    {"Pratique principale": "Petits ruminants", "Effectif": 0},
-    {"Pratique principale": "Grandes populations animales", "Effectif": 42},
-    {"Pratique principale": "Faune et zoos", "Effectif": 15},
-    {"Pratique principale": "Animaux de bassecour", "Effectif": 1},
-])
-qc_practice_main["Part (%)"] = (qc_practice_main["Effectif"] / QC_OMVQ_MEMBERS_TOTAL * 100).round(1)
-
-# Officiel (OMVQ — constats pour animaux de compagnie)
-QC_COMPANION_MONTÉRÉGIE_N = 405  # "Montérégie (24%; n=405)"
-QC_COMPANION_MONTRÉAL_N = 352    # "Montréal (21%; n=352)"
-QC_COMPANION_ABITIBI_N = 20      # "Abitibi-Témiscamingue (1%; n=20)"
-QC_COMPANION_GASPÉSIE_N = 10     # "Gaspésie–Îles-de-la-Madeleine (1%; n=10)"
-QC_COMPANION_CÔTE_NORD_N = 9     # "Côte-Nord (1%; n=9)"
-QC_COMPANION_NORD_DU_QC_N = 2    # "Nord-du-Québec (<1%; n=2)"
+# Streamlit efface l'état d'un widget qui n'est pas affiché pendant un rerun (changement de vue) : la valeur
+# est tenue dans une clé hors widget, st.session_state[key], mise à jour par on_change et reprise au retour.
+def kept(key: str, default) -> tuple:
+    """(valeur conservée, kwargs key / on_change du widget)."""
+    widget_key = f"widget_{key}"
+
+    def store():
+        st.session_state[key] = st.session_state[widget_key]
+
+    if key not in st.session_state:
+        st.session_state[key] = default
+    return st.session_state[key], {"key": widget_key, "on_change": store}
+
 
 # -----------------------------
-# Interface
+# Graphiques en cache
 # -----------------------------
-tab_ca, tab_qc, tab_scen, tab_sources = st.tabs([
-    "Canada (CVMA)",
-    "Québec (OMVQ)",
-    "Scénarios (estimation)",
-    "Sources (liens)"
-])
+def plot(chart_id: str):
+    # Lecture du cache de figures + sérialisation Streamlit, chronométrées ensemble.
+    with perf.section(f"graphique : {chart_id}"):
+        st.plotly_chart(get_figure(chart_id).figure, use_container_width=True)
+
 
 # -----------------------------
 # Canada (CVMA)
 # -----------------------------
-with tab_ca:
+MAP_LEVELS = {"low": "Aperçu", "medium": "Standard", "high": "Détaillé"}
+
+
+# Fragment : changer le niveau de détail ne réexécute que la carte. Le choix de l'indicateur se fait dans
+# la carte elle-même (menu) : seules les couleurs changent, sans nouvel envoi de la géométrie.
+@st.fragment
+def canada_map_section():
+    if not figures.available("ca_map_medium"):
+        st.info(
+            "Carte indisponible : déposer les limites provinciales (GeoJSON, WGS84) dans "
+            "`data/geo/ca_provinces.geojson` (voir `linkinvet/geo.py`)."
+        )
+        return
+    level, widget = kept("ca_map_level", "medium")
+    level = st.radio("Niveau de détail", list(MAP_LEVELS), index=list(MAP_LEVELS).index(level), format_func=MAP_LEVELS.get, horizontal=True, **widget)
+    plot(f"ca_map_{level}")
+
+
+def render_canada():
     st.subheader("Canada — Indicateurs nationaux (CVMA, 2023-24)")
 
     c1, c2, c3, c4 = st.columns(4)
     c1.metric("Vétérinaires enregistrés (2024)", f"{CAN_REGISTERED_VETS_2024:,}".replace(",", " "))
     c2.metric("Vétérinaires actifs (2023-24)", f"{CAN_ACTIVE_VETS_2023_24:,}".replace(",", " "))
     c3.metric("Établissements accrédités (2023-24)", f"{CAN_ACCREDITED_FACILITIES_2023_24:,}".replace(",", " "))
-    c4.metric("Ratio (vétos / établissement) — indicateur dérivé", f"{CAN_ACTIVE_VETS_2023_24 / CAN_ACCREDITED_FACILITIES_2023_24:.2f}")
+    c4.metric("Ratio (vétos / établissement) — indicateur dérivé", f"{derived('can_ratio'):.2f}")
 
     st.markdown("#### Contribution économique (CVMA, 2023-24 — Canada)")
     e1, e2, e3, e4 = st.columns(4)
     e1.metric("Production totale (M$ CAD)", f"{CAN_OUTPUT_MCAD:,.1f}".replace(",", " "))
     e2.metric("PIB total (M$ CAD)", f"{CAN_GDP_MCAD:,.1f}".replace(",", " "))
     e3.metric("Emplois (ETP/FTE)", f"{CAN_EMPLOYMENT_FTE:,}".replace(",", " "))
-    e4.metric("Recettes fiscales totales (M$ CAD)", f"{(CAN_TAX_FED_MCAD + CAN_TAX_PROV_MCAD + CAN_TAX_MUNI_MCAD):,.1f}".replace(",", " "))
+    e4.metric("Recettes fiscales totales (M$ CAD)", f"{derived('can_tax_total'):,.1f}".replace(",", " "))
+
+    m1, m2, m3, _ = st.columns(4)
+    m1.metric("Multiplicateur — production (dérivé)", f"{derived('can_output_multiplier'):.2f}")
+    m2.metric("Multiplicateur — PIB (dérivé)", f"{derived('can_gdp_multiplier'):.2f}")
+    m3.metric("Multiplicateur — emplois (dérivé)", f"{derived('can_employment_multiplier'):.2f}")
 
     st.caption(
         "Note méthodologique (CVMA) : l’accréditation en Ontario a changé en 2023, ce qui limite certaines comparaisons historiques. "
@@ -168,41 +194,90 @@ with tab_ca:
     left, right = st.columns(2)
 
     with left:
-        fig = px.bar(
-            df_ca.sort_values("Vétérinaires actifs (2023-24)", ascending=False),
-            x="Juridiction",
-            y="Vétérinaires actifs (2023-24)",
-            title="Vétérinaires actifs par juridiction (2023-24)"
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        plot("ca_vets")
 
     with right:
-        fig = px.bar(
-            df_ca.sort_values("Établissements accrédités (2023-24)", ascending=False),
-            x="Juridiction",
-            y="Établissements accrédités (2023-24)",
-            title="Établissements accrédités par juridiction (2023-24)"
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        plot("ca_facilities")
 
     st.markdown("#### Intensité par établissement (indicateur dérivé)")
-    fig = px.bar(
-        df_ca.sort_values("Ratio (vétos / établissement) — indicateur dérivé", ascending=False),
-        x="Juridiction",
-        y="Ratio (vétos / établissement) — indicateur dérivé",
-        title="Ratio vétérinaires actifs / établissements accrédités (proxy de concentration)"
-    )
-    st.plotly_chart(fig, use_container_width=True)
+    plot("ca_ratio")
 
-    st.dataframe(
-        df_ca.sort_values("Vétérinaires actifs (2023-24)", ascending=False),
-        use_container_width=True
+    st.markdown("#### Densité par habitant (indicateurs dérivés)")
+    left, right = st.columns(2)
+
+    with left:
+        plot("ca_vets_per_10k")
+
+    with right:
+        plot("ca_facilities_per_100k")
+
+    st.caption(
+        "Population : estimations de Statistique Canada au 1er juillet 2023 (tableau 17-10-0009-01). "
+        "Les territoires, à faible population, sont sensibles à quelques unités près."
     )
 
+    st.markdown("#### Carte des juridictions (CVMA, 2023-24)")
+    canada_map_section()
+
+    with perf.section("tableau : df_ca"):
+        st.dataframe(
+            df_ca.sort_values(VETS_COLUMN, ascending=False),
+            use_container_width=True
+        )
+
+    st.markdown("#### Évolution pluriannuelle (CVMA, toutes éditions chargées)")
+    timeseries = get_cvma_timeseries()
+    if timeseries["Période"].nunique() < 2:
+        st.info(
+            "Une seule édition CVMA est chargée : l’évolution s’affichera dès l’ajout d’une autre édition "
+            "(`python -m linkinvet.dataset ingest <édition.csv> --name cvma-<période>`)."
+        )
+    else:
+        left, right = st.columns(2)
+        with left:
+            plot("ca_ts_vets")
+        with right:
+            plot("ca_ts_vets_yoy")
+        st.caption(
+            "Comparabilité : l’accréditation en Ontario a changé en 2023 ; les variations ON autour de cette date "
+            "reflètent en partie ce changement de modèle."
+        )
+
 # -----------------------------
 # Québec (OMVQ)
 # -----------------------------
-with tab_qc:
+# Régions signalées par l'OMVQ comme plus touchées par le manque de vétérinaires (animaux de compagnie)
+UNDERSERVED_REGIONS = ("08", "09", "10", "11")
+
+
+# Fragment : changer le rayon ne refait que l'agrégation (la requête spatiale est en cache).
+@st.fragment
+def access_section():
+    if not access.available():
+        st.info(
+            "Analyse indisponible : déposer les coordonnées des établissements (`data/geo/facilities.csv`) et les "
+            "centroïdes de population (`data/geo/centroids.csv`) — voir `linkinvet/access.py`."
+        )
+        return
+    radius, widget = kept("access_radius", 50)
+    radius = st.select_slider("Rayon (km)", options=access.DEFAULT_RADII_KM, value=radius, **widget)
+    with perf.section("accès : requête spatiale"):
+        result = access.analyse()
+    summary = access.summarize(result, (radius,))
+    regions = get_qc_regions().set_index("Code")["Région administrative"]
+    if "region" in summary.columns:
+        summary.insert(1, "Région administrative", summary["region"].map(regions))
+        summary["Signalée par l’OMVQ"] = summary["region"].isin(UNDERSERVED_REGIONS)
+    st.dataframe(summary.round(1), use_container_width=True, hide_index=True)
+    st.caption(
+        f"{len(result):,} centroïdes de population ; distances orthodromiques à vol d’oiseau "
+        "(et non temps de trajet).".replace(",", " ")
+    )
+
+
+def render_quebec():
+    qc_practice_main = get_qc_practice_main()
+
     st.subheader("Québec — Indicateurs (OMVQ, au 26 septembre 2024)")
 
     q1, q2, q3, q4 = st.columns(4)
@@ -215,13 +290,7 @@ with tab_qc:
     left, right = st.columns([2, 1])
 
     with left:
-        fig = px.bar(
-            qc_practice_main.sort_values("Effectif", ascending=False),
-            x="Pratique principale",
-            y="Effectif",
-            title="Répartition des pratiques principales (effectifs)"
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        plot("qc_practice")
 
     with right:
         st.markdown("**Points saillants (officiels)**")
@@ -255,6 +324,25 @@ dans ce domaine, notamment :
 """
     )
 
+    st.markdown("#### Régions administratives du Québec (OMVQ)")
+    if figures.available("qc_regions_map"):
+        plot("qc_regions_map")
+    else:
+        st.info(
+            "Carte indisponible : déposer les limites des régions administratives (GeoJSON, WGS84) dans "
+            "`data/geo/qc_regions.geojson` (voir `linkinvet/geo.py`)."
+        )
+    with perf.section("tableau : régions QC"):
+        st.dataframe(get_qc_regions(), use_container_width=True, hide_index=True)
+    st.caption(
+        "Cases vides : valeur non reprise dans la table de faits. Les répartitions complètes s’ajoutent depuis le "
+        "document OMVQ (`python -m linkinvet.pdf_ingest omvq <portrait.pdf> --period 2024-09-26 --name omvq-2024 --ingest --replace` ; "
+        "les valeurs de la partition que l’extraction ne reconnaît pas sont conservées)."
+    )
+
+    st.markdown("#### Accessibilité — distance à l’établissement le plus proche (indicateur dérivé)")
+    access_section()
+
     st.info(
         "Important : OMVQ mesure les **membres** au Québec (au 26 septembre 2024). "
         "CVMA mesure les **vétérinaires actifs** par juridiction (année 2023-24). "
@@ -264,7 +352,200 @@ dans ce domaine, notamment :
 # -----------------------------
 # Scénarios (estimation)
 # -----------------------------
-with tab_scen:
+# Lien partageable : ?juris=<code>&solo_share=<%> restaure le scénario (et ouvre la vue Scénarios).
+# Les valeurs de l'URL ne servent qu'à initialiser le scénario (clés "juris" / "solo_share") au premier rerun
+# de la session.
+def scenario_from_query():
+    labels = jurisdiction_labels()
+    juris = labels.get(st.query_params.get("juris", "").upper())
+    try:
+        solo_share = int(st.query_params.get("solo_share", ""))
+    except ValueError:
+        solo_share = None
+    if juris not in df_ca["Juridiction"].tolist():
+        juris = None
+    if solo_share not in SOLO_SHARE_GRID:
+        solo_share = None
+    return juris, solo_share
+
+
+if "juris" not in st.session_state:
+    query_juris, query_solo_share = scenario_from_query()
+    st.session_state["juris"] = query_juris or DEFAULT_JURIS
+    st.session_state["solo_share"] = DEFAULT_SOLO_SHARE if query_solo_share is None else query_solo_share
+    if query_juris or query_solo_share is not None:
+        st.session_state["view"] = "Scénarios (estimation)"
+
+
+# Fragment : une interaction sur la juridiction ou la part "solo" ne réexécute que ce bloc
+# (et ne renvoie au navigateur que ces éléments), pas les graphiques des autres onglets.
+@st.fragment
+def scenario_section():
+    juris, widget = kept("juris", DEFAULT_JURIS)
+    juris = st.selectbox("Juridiction (CVMA, 2023-24)", df_ca["Juridiction"].tolist(), index=df_ca["Juridiction"].tolist().index(juris), **widget)
+    st.markdown("##### Hypothèses de scénario")
+    solo_share, widget = kept("solo_share", DEFAULT_SOLO_SHARE)
+    solo_share = st.slider("Part hypothétique d’établissements à vétérinaire unique (%)", min_value=0, max_value=80, value=solo_share, step=5, **widget)
+    # Hypothèse explicite (linkinvet/scenario.py) : 1 vétérinaire actif par établissement "solo"
+    # Résultat mémoïsé pour tout le processus, par (juridiction, part solo)
+    with perf.section("scénario : calcul"):
+        res = scenario_point(juris, solo_share)
+    vets, facs, ratio = res["vets"], res["facs"], res["ratio"]
+
+    a1, a2, a3 = st.columns(3)
+    a1.metric("Vétérinaires actifs (officiel)", f"{int(vets):,}".replace(",", " "))
+    a2.metric("Établissements accrédités (officiel)", f"{int(facs):,}".replace(",", " "))
+    a3.metric("Ratio (indicateur dérivé)", f"{ratio:.2f}")
+
+    s1, s2, s3 = st.columns(3)
+    s1.metric("Établissements 'solo' (estim.)", f"{res['solo_facilities']:.0f}")
+    s2.metric("Vétérinaires 'solo' (estim.)", f"{res['solo_vets_est']:.0f}")
+    s3.metric("Vétérinaires en structure multi (estim.)", f"{res['multi_vets_est']:.0f}")
+
+    # URL du navigateur tenue à jour : le lien copié restaure exactement ce scénario
+    code = juris.rsplit("(", 1)[-1].rstrip(")")
+    st.query_params.update(juris=code, solo_share=str(solo_share))
+    st.caption(f"Lien partageable : `?juris={code}&solo_share={solo_share}`")
+
+
+# Fragment : le mode incertitude se recalcule (ou se relit en cache) sans réexécuter le reste de la page.
+@st.fragment
+def montecarlo_section():
+    kinds = ["triangulaire", "uniforme"]
+    kind, widget = kept("mc_kind", kinds[0])
+    kind = st.radio("Forme des distributions", kinds, index=kinds.index(kind), horizontal=True, **widget)
+    share0, vps0 = MC_DEFAULT_SOLO_SHARE, MC_DEFAULT_VETS_PER_SOLO
+    m1, m2 = st.columns(2)
+    with m1:
+        value, widget = kept("mc_share_range", (share0.low, share0.high))
+        share_low, share_high = st.slider("Part solo (%) — min / max", 0, 80, value, step=1, **widget)
+        value, widget = kept("mc_share_mode", share0.mode)
+        share_mode = st.slider("Part solo (%) — valeur la plus probable", 0, 80, value, step=1, disabled=kind == "uniforme", **widget)
+    with m2:
+        value, widget = kept("mc_vps_range", (vps0.low, vps0.high))
+        vps_low, vps_high = st.slider("Vétérinaires par établissement solo — min / max", 1.0, 3.0, value, step=0.05, **widget)
+        value, widget = kept("mc_vps_mode", vps0.mode)
+        vps_mode = st.slider("Vétérinaires par établissement solo — valeur la plus probable", 1.0, 3.0, value, step=0.05, disabled=kind == "uniforme", **widget)
+    n_draws, widget = kept("mc_n", MC_DEFAULT_DRAWS)
+    n_draws = st.select_slider("Nombre de tirages", options=MC_DRAW_OPTIONS, value=n_draws, **widget)
+
+    with perf.section("scénario : monte carlo"):
+        result = monte_carlo(
+            Distribution(kind, share_low, share_mode, share_high),
+            Distribution(kind, vps_low, vps_mode, vps_high),
+            n_draws=n_draws,
+        )
+
+    output_key, widget = kept("mc_output", list(MC_OUTPUTS)[2])
+    output_key = st.selectbox("Indicateur", list(MC_OUTPUTS), index=list(MC_OUTPUTS).index(output_key), format_func=MC_OUTPUTS.get, **widget)
+    table = result.percentiles[result.percentiles["Indicateur"] == MC_OUTPUTS[output_key]]
+    st.dataframe(table.drop(columns="Indicateur").round(0), use_container_width=True, hide_index=True)
+
+    mc_juris, widget = kept("mc_juris", DEFAULT_JURIS)
+    mc_juris = st.selectbox("Juridiction (histogramme)", table["Juridiction"].tolist(), index=table["Juridiction"].tolist().index(mc_juris), **widget)
+    edges, counts = result.histograms[(mc_juris, output_key)]
+    st.plotly_chart(
+        histogram_figure(edges, counts, f"{MC_OUTPUTS[output_key]} — {mc_juris} ({n_draws:,} tirages)".replace(",", " "), MC_OUTPUTS[output_key]),
+        use_container_width=True,
+    )
+
+
+# Fragment : la grille de perturbations est calculée une fois pour toutes les juridictions (et mise en cache) ;
+# changer de juridiction ou d'indicateur ne fait que filtrer la table.
+@st.fragment
+def sensitivity_section():
+    t0, t1, t2, t3 = st.columns(4)
+    with t0:
+        # Point de base propre à ce fragment : le curseur du scénario vit dans un autre fragment, dont l'état
+        # n'est pas relu ici (il ne déclenche pas ce fragment). Initialisé depuis le scénario de la session.
+        solo_share, widget = kept("sens_solo_share", st.session_state.get("solo_share", DEFAULT_SOLO_SHARE))
+        solo_share = st.slider("Part solo de référence (%)", 0, 80, solo_share, step=5, **widget)
+    with t1:
+        pct, widget = kept("sens_pct", DEFAULT_SENSITIVITY_PCT)
+        pct = st.slider("Perturbation de chaque hypothèse (± %)", 5, 50, pct, step=5, **widget)
+    with t2:
+        outputs = list(SENSITIVITY_OUTPUTS.values())
+        output, widget = kept("sens_output", outputs[0])
+        output = st.selectbox("Indicateur", outputs, index=outputs.index(output), **widget)
+    with t3:
+        juris, widget = kept("sens_juris", DEFAULT_JURIS)
+        juris = st.selectbox("Juridiction", df_ca["Juridiction"].tolist(), index=df_ca["Juridiction"].tolist().index(juris), **widget)
+
+    with perf.section("scénario : sensibilité"):
+        table = sensitivity(pct, solo_share)
+    subset = table[(table["Indicateur"] == output) & (table["Juridiction"] == juris)]
+    st.plotly_chart(
+        tornado_figure(subset, f"Sensibilité — {juris} (part solo {solo_share} %, ±{pct} %)", pct),
+        use_container_width=True,
+    )
+    st.caption(f"Part solo perturbée de ±{pct} points de pourcentage (bornée à 0–100 %) ; autres hypothèses de ±{pct} %.")
+
+
+# Fragment : les chocs d'activité se réévaluent sans réexécuter le reste de la page.
+@st.fragment
+def impact_section():
+    i1, i2 = st.columns([2, 1])
+    with i1:
+        shocked, widget = kept("impact_juris", [DEFAULT_JURIS])
+        shocked = st.multiselect("Juridictions touchées", df_ca["Juridiction"].tolist(), default=shocked, **widget)
+    with i2:
+        pct, widget = kept("impact_pct", 10)
+        pct = st.slider("Variation de l’activité directe (%)", -30, 30, pct, step=5, **widget)
+
+    # Référence et choc évalués ensemble : (2, juridictions, mesures)
+    shock = shock_matrix(shocked, pct)
+    with perf.section("scénario : impact"):
+        res = evaluate(np.stack([np.zeros_like(shock), shock]))
+    delta = res["total"][1] - res["total"][0]
+    labels = [label for _, _, label in MEASURES.values()]
+
+    d1, d2, d3, d4 = st.columns(4)
+    for col, label, value in zip((d1, d2, d3), labels, delta.sum(axis=0)):
+        col.metric(f"Δ {label} — total Canada", f"{value:+,.1f}".replace(",", " "))
+    d4.metric("Δ Recettes fiscales (M$ CAD)", f"{(res['taxes'][1] - res['taxes'][0]).sum():+,.1f}".replace(",", " "))
+
+    with st.expander("Répartition de référence (juridictions × mesures)"):
+        st.dataframe(impact_table(), use_container_width=True, hide_index=True)
+
+
+# Fragment : la projection se recalcule (ou se relit en cache) à chaque curseur sans réexécuter la page.
+@st.fragment
+def workforce_section():
+    w1, w2, w3 = st.columns(3)
+    with w1:
+        value, widget = kept("wf_years", workforce.DEFAULT_YEARS)
+        years = st.slider("Horizon (années)", 10, 20, value, **widget)
+        value, widget = kept("wf_grads", workforce.DEFAULT_GRADUATES_PCT)
+        graduates = st.slider("Diplômés par an (% de l’effectif initial)", 0.0, 10.0, value, step=0.5, **widget)
+    with w2:
+        value, widget = kept("wf_attrition", workforce.DEFAULT_ATTRITION_PCT)
+        attrition = st.slider("Attrition annuelle hors retraite (%)", 0.0, 6.0, value, step=0.25, **widget)
+        value, widget = kept("wf_female", workforce.DEFAULT_FEMALE_SHARE_GRADS)
+        female_grads = st.slider("Part de femmes parmi les diplômés (%)", 0.0, 100.0, value, step=5.0, **widget)
+    with w3:
+        value, widget = kept("wf_ret_age", workforce.DEFAULT_RETIREMENT_AGE)
+        retirement_age = st.slider("Âge de retraite", 55, 70, value, **widget)
+        value, widget = kept("wf_ret_pct", workforce.DEFAULT_RETIREMENT_PCT)
+        retirement = st.slider("Départs annuels au-delà de cet âge (%)", 0.0, 100.0, value, step=5.0, **widget)
+
+    with perf.section("scénario : projection"):
+        table = workforce.projection_table(years, graduates, female_grads, attrition, retirement_age, retirement)
+    by_juris = table.groupby(["Juridiction", "Année"], sort=False, as_index=False)["Effectif (estim.)"].sum()
+    selected, widget = kept("wf_juris", [DEFAULT_JURIS, "Ontario (ON)"])
+    selected = st.multiselect("Juridictions", df_ca["Juridiction"].tolist(), default=selected, **widget)
+    st.plotly_chart(
+        projection_figure(by_juris[by_juris["Juridiction"].isin(selected)], "Vétérinaires actifs projetés (estimation)"),
+        use_container_width=True,
+    )
+
+    final = table[table["Année"] == table["Année"].max()].pivot(index="Juridiction", columns="Sexe", values="Effectif (estim.)")
+    final = final.reindex(df_ca["Juridiction"]).round(0)
+    final["Total"] = final.sum(axis=1)
+    final["Variation vs 2023-24 (%)"] = (final["Total"] / df_ca.set_index("Juridiction")[VETS_COLUMN] - 1) * 100
+    st.dataframe(final.round(1), use_container_width=True)
+
+
+def render_scenarios():
     st.subheader("Scénarios (estimation) — organisation des établissements")
     st.markdown(
         """
@@ -279,40 +560,66 @@ Les résultats affichés ici sont des **estimations conditionnelles** à des hyp
 """
     )
 
-    juris = st.selectbox("Juridiction (CVMA, 2023-24)", df_ca["Juridiction"].tolist(), index=df_ca["Juridiction"].tolist().index("Québec (QC)"))
-    row = df_ca[df_ca["Juridiction"] == juris].iloc[0]
-    vets = float(row["Vétérinaires actifs (2023-24)"])
-    facs = float(row["Établissements accrédités (2023-24)"])
-    ratio = float(row["Ratio (vétos / établissement) — indicateur dérivé"])
+    scenario_section()
 
-    a1, a2, a3 = st.columns(3)
-    a1.metric("Vétérinaires actifs (officiel)", f"{int(vets):,}".replace(",", " "))
-    a2.metric("Établissements accrédités (officiel)", f"{int(facs):,}".replace(",", " "))
-    a3.metric("Ratio (indicateur dérivé)", f"{ratio:.2f}")
+    st.caption(
+        "Transparence : ce module n’infère pas une réalité observée. Il applique des hypothèses paramétrables "
+        "à des agrégats officiels (CVMA)."
+    )
 
-    st.markdown("##### Hypothèses de scénario")
-    solo_share = st.slider("Part hypothétique d’établissements à vétérinaire unique (%)", min_value=0, max_value=80, value=20, step=5)
-    solo_facilities = facs * (solo_share / 100.0)
-    multi_facilities = facs - solo_facilities
+    st.markdown("#### Surface de sensibilité — toutes juridictions × part solo (estimation)")
+    plot("scen_heatmap")
+    with st.expander("Table complète du scénario (12 juridictions × parts solo 0–80 %)"):
+        grid = scenario_grid()
+        st.dataframe(grid, use_container_width=True, hide_index=True)
+        st.download_button(
+            "Télécharger (CSV)",
+            grid.to_csv(index=False).encode("utf-8"),
+            file_name="linkinvet_scenario_solo_multi.csv",
+            mime="text/csv",
+        )
+
+    st.markdown("#### Sensibilité aux hypothèses (diagramme en tornade)")
+    st.caption(
+        "Chaque hypothèse (et chaque chiffre officiel utilisé) est perturbée seule de ± X % autour de la part solo "
+        "de référence choisie ci-dessous ; les barres les plus longues désignent les hypothèses les plus déterminantes."
+    )
+    sensitivity_section()
 
-    # Hypothèse explicite : 1 vétérinaire actif par établissement "solo"
-    solo_vets_est = solo_facilities * 1.0
-    multi_vets_est = max(vets - solo_vets_est, 0)
+    st.markdown("#### Impact économique par juridiction (estimation)")
+    st.markdown(
+        """
+Les multiplicateurs (production, PIB, emplois) sont **dérivés** de la Table 1 CVMA (impact total / impact direct).
+Les impacts directs nationaux sont répartis entre juridictions **au prorata des vétérinaires actifs** :
+cette répartition est une hypothèse, la CVMA ne publiant pas ces tables par province.
+"""
+    )
+    impact_section()
 
-    s1, s2, s3 = st.columns(3)
-    s1.metric("Établissements 'solo' (estim.)", f"{solo_facilities:.0f}")
-    s2.metric("Vétérinaires 'solo' (estim.)", f"{solo_vets_est:.0f}")
-    s3.metric("Vétérinaires en structure multi (estim.)", f"{multi_vets_est:.0f}")
+    st.markdown("#### Projection de l’effectif (modèle par cohortes, estimation)")
+    st.markdown(
+        """
+L’effectif actif CVMA (2023-24) est vieilli année par année : entrées de diplômés, attrition et départs à la retraite.
+Répartition par sexe : OMVQ pour le Québec, part québécoise appliquée ailleurs (hypothèse) ;
+répartition par âge : uniforme de 26 à 64 ans (hypothèse, faute de source agrégée par âge).
+"""
+    )
+    workforce_section()
 
-    st.caption(
-        "Transparence : ce module n’infère pas une réalité observée. Il applique des hypothèses paramétrables "
-        "à des agrégats officiels (CVMA)."
+    st.markdown("#### Mode incertitude (Monte Carlo)")
+    st.markdown(
+        """
+La part d’établissements solo et le nombre de vétérinaires par établissement solo sont tirés
+de distributions paramétrables ; les bandes P5–P95 résument l’incertitude **liée aux hypothèses**
+(et non une incertitude statistique sur les chiffres officiels).
+"""
     )
+    montecarlo_section()
 
 # -----------------------------
 # Sources (liens)
 # -----------------------------
-with tab_sources:
+def render_sources():
     st.subheader("Sources (liens officiels)")
 
     st.markdown(
@@ -327,7 +634,11 @@ Ce rapport contient notamment :
 **2) CVMA — Economic Impact Study 2024 Update (page de synthèse)**  
 - https://www.canadianveterinarians.net/about-cvma/latest-news/economic-impact-study-2024-update/
 
-**3) OMVQ — Portrait démographique de la profession vétérinaire au Québec (au 26 septembre 2024)**  
+**3) Statistique Canada — Estimations de la population, trimestrielles (tableau 17-10-0009-01)**  
+- https://www150.statcan.gc.ca/t1/tbl1/fr/tv.action?pid=1710000901  
+Utilisé uniquement comme dénominateur des indicateurs « par habitant » (population au 1er juillet 2023).
+
+**4) OMVQ — Portrait démographique de la profession vétérinaire au Québec (au 26 septembre 2024)**  
 - Document complet (PDF) : https://www.omvq.qc.ca/DATA/TEXTEDOC/2024---Portrait-de-la-profession-veterinaire---Document.pdf  
 Ce document contient notamment :
 - 2 804 membres au Québec
@@ -341,7 +652,59 @@ Ce document contient notamment :
     st.markdown(
         """
 - Les chiffres “Officiel” sont copiés **tels quels** des documents CVMA/OMVQ.
-- Les “Indicateurs dérivés” sont des **ratios** calculés directement à partir des agrégats officiels.
+- Les “Indicateurs dérivés” sont des **ratios** calculés directement à partir des agrégats officiels
+  (dont les densités par habitant, rapportées à la population de Statistique Canada).
 - Les “Scénarios” sont des **estimations** basées sur hypothèses explicites (paramétrables).
 """
     )
+
+# -----------------------------
+# Interface — navigation
+# -----------------------------
+# Seule la vue active est calculée et envoyée au navigateur : contrairement à st.tabs, qui exécute
+# et transmet le contenu de tous les onglets à chaque rerun.
+VIEWS = {
+    "Canada (CVMA)": render_canada,
+    "Québec (OMVQ)": render_quebec,
+    "Scénarios (estimation)": render_scenarios,
+    "Sources (liens)": render_sources,
+}
+view = st.radio("Vue", list(VIEWS), horizontal=True, label_visibility="collapsed", key="view")
+with perf.section(f"vue : {view}"):
+    VIEWS[view]()
+
+# -----------------------------
+# Débogage (?debug=1) — placé en fin de script pour inclure les accès de ce rerun
+# -----------------------------
+if st.query_params.get("debug") == "1":
+    with st.sidebar.expander("Débogage — cache des figures", expanded=True):
+        stats = figures.cache_stats()
+        st.markdown(f"Version des données : `{dataset_version()}`")
+        d1, d2 = st.columns(2)
+        d1.metric("Succès (hits)", stats["hits"])
+        d2.metric("Échecs (misses)", stats["misses"])
+        st.caption(f"{stats['entries']} figure(s) en cache")
+        if warmup.import_times:
+            st.caption("Imports préchauffés : " + ", ".join(f"{m} {t * 1000:.0f} ms" for m, t in warmup.import_times.items()))
+
+# -----------------------------
+# Admin (?admin=<LINKINVET_ADMIN_TOKEN>) — temps par section, p50 / p95 sur toutes les sessions du processus
+# -----------------------------
+if os.environ.get("LINKINVET_ADMIN_TOKEN") and st.query_params.get("admin") == os.environ["LINKINVET_ADMIN_TOKEN"]:
+    with st.sidebar.expander("Admin — temps par section", expanded=True):
+        timings = perf.summary()
+        st.dataframe(timings, use_container_width=True, hide_index=True)
+        st.download_button(
+            "Exporter (JSON)",
+            json.dumps(timings, ensure_ascii=False, indent=2),
+            file_name="linkinvet_perf.json",
+            mime="application/json",
+        )
+        st.caption(f"Journal JSON par rerun : {perf.LOG_PATH or 'désactivé (LINKINVET_PERF_LOG)'}")
+        # Vide les caches de tout le processus (toutes les sessions) : réservé à l'admin.
+        if st.button("Recharger les données (data/facts)"):
+            data.invalidate()
+            figures.clear()
+            st.rerun()
+
+perf.end_run()
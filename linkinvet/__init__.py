@@ -0,0 +1 @@
+# LinkinVet — couche de données et de calcul du tableau de bord marché vétérinaire.
@@ -0,0 +1,157 @@
+# Accessibilité géographique — distance de chaque centroïde de population à l'établissement vétérinaire
+# le plus proche, et population à moins de X km d'un établissement. Indicateur dérivé (fichiers locaux).
+#
+# Fichiers attendus dans data/geo/ (non versionnés) :
+#   facilities.csv  — lat, lon (WGS84) [, name] : un établissement par ligne
+#   centroids.csv   — id, lat, lon, population [, region] : centroïdes (ex. îlots de diffusion de
+#                     Statistique Canada) ; region = code de région administrative (01–17) si disponible
+#
+# Index spatial : arbre k-d (scipy cKDTree) sur les points projetés sur la sphère unité (x, y, z) ;
+# la distance de corde est convertie en distance orthodromique. Requête en bloc pour tous les
+# centroïdes : quelques secondes pour des centaines de milliers de points. Résultats mis en cache
+# par empreinte des deux fichiers.
+#
+#   python -m linkinvet.access --radius 25 --radius 50 --radius 100
+#   python -m linkinvet.access --out data/staging/access.csv
+
+import argparse
+import hashlib
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow.csv as pa_csv
+
+from linkinvet import geo
+
+EARTH_RADIUS_KM = 6371.0088
+FACILITIES_CSV = geo.GEO_DIR / "facilities.csv"
+CENTROIDS_CSV = geo.GEO_DIR / "centroids.csv"
+DEFAULT_RADII_KM = (25, 50, 100)
+
+
+def available() -> bool:
+    return FACILITIES_CSV.exists() and CENTROIDS_CSV.exists()
+
+
+@lru_cache(maxsize=16)
+def _file_digest(path: Path, mtime_ns: int, size: int) -> bytes:
+    # Clé (chemin, date, taille) : le fichier n'est relu que s'il a changé.
+    return hashlib.sha256(path.read_bytes()).digest()
+
+
+def input_version(facilities: Path = FACILITIES_CSV, centroids: Path = CENTROIDS_CSV) -> str:
+    """Empreinte courte des deux fichiers d'entrée."""
+    h = hashlib.sha256()
+    for path in (Path(facilities), Path(centroids)):
+        stat = path.stat()
+        h.update(_file_digest(path, stat.st_mtime_ns, stat.st_size))
+    return h.hexdigest()[:12]
+
+
+def unit_vectors(lat, lon) -> np.ndarray:
+    """Coordonnées (degrés) -> points (n, 3) sur la sphère unité."""
+    lat, lon = np.radians(np.asarray(lat, dtype=float)), np.radians(np.asarray(lon, dtype=float))
+    cos_lat = np.cos(lat)
+    return np.column_stack([cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)])
+
+
+def chord_to_km(chord):
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.clip(np.asarray(chord) / 2, 0, 1))
+
+
+def km_to_chord(km):
+    return 2 * np.sin(np.asarray(km, dtype=float) / (2 * EARTH_RADIUS_KM))
+
+
+def _read(path: Path, required: tuple) -> pd.DataFrame:
+    table = pa_csv.read_csv(path).to_pandas()
+    missing = set(required) - set(table.columns)
+    if missing:
+        raise ValueError(f"{path.name} : colonne(s) manquante(s) {sorted(missing)}")
+    return table
+
+
+@lru_cache(maxsize=4)
+def _analyse(version: str, facilities: Path, centroids: Path, radii_km: tuple) -> pd.DataFrame:
+    from scipy.spatial import cKDTree
+
+    fac = _read(facilities, ("lat", "lon"))
+    cen = _read(centroids, ("id", "lat", "lon", "population"))
+    tree = cKDTree(unit_vectors(fac["lat"], fac["lon"]))
+    points = unit_vectors(cen["lat"], cen["lon"])
+
+    chord, nearest = tree.query(points, k=1, workers=-1)
+    result = pd.DataFrame({
+        "id": cen["id"],
+        "population": cen["population"].to_numpy(dtype=float),
+        "Distance établissement le plus proche (km)": chord_to_km(chord),
+        "Établissement le plus proche (index)": nearest,
+    })
+    if "region" in cen.columns:
+        result.insert(1, "region", cen["region"].astype(str).str.zfill(2))
+    for radius in radii_km:
+        result[f"Établissements à ≤ {radius:g} km"] = tree.query_ball_point(
+            points, km_to_chord(radius), return_length=True, workers=-1
+        )
+    return result
+
+
+def analyse(radii_km=DEFAULT_RADII_KM, facilities: Path = FACILITIES_CSV, centroids: Path = CENTROIDS_CSV) -> pd.DataFrame:
+    """Une ligne par centroïde : distance au plus proche établissement et nombre d'établissements par rayon.
+
+    Mis en cache par (empreinte des fichiers, rayons) — partagé, lecture seule.
+    """
+    return _analyse(input_version(facilities, centroids), Path(facilities), Path(centroids), tuple(float(r) for r in radii_km))
+
+
+def summarize(result: pd.DataFrame, radii_km=DEFAULT_RADII_KM, by: str | None = "region") -> pd.DataFrame:
+    """Agrégats pondérés par la population (par région si la colonne existe, sinon ensemble)."""
+    distance = result["Distance établissement le plus proche (km)"].to_numpy()
+    population = result["population"].to_numpy()
+    keys = result[by].to_numpy() if by and by in result.columns else np.full(len(result), "Ensemble")
+    codes, inverse = np.unique(keys, return_inverse=True)
+
+    pop_total = np.bincount(inverse, weights=population, minlength=len(codes))
+    summary = pd.DataFrame({
+        by if by in result.columns else "Zone": codes,
+        "Population": pop_total,
+        "Distance moyenne pondérée (km)": np.bincount(inverse, weights=population * distance, minlength=len(codes)) / pop_total,
+    })
+    for radius in radii_km:
+        covered = np.bincount(inverse, weights=population * (distance <= radius), minlength=len(codes))
+        summary[f"Population à ≤ {radius:g} km d'un établissement (%)"] = covered / pop_total * 100
+    return summary
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(prog="python -m linkinvet.access")
+    parser.add_argument("--facilities", type=Path, default=FACILITIES_CSV)
+    parser.add_argument("--centroids", type=Path, default=CENTROIDS_CSV)
+    parser.add_argument("--radius", type=float, action="append", help="rayon en km (répétable ; défaut : 25, 50, 100)")
+    parser.add_argument("--out", type=Path, help="CSV détaillé (une ligne par centroïde)")
+    args = parser.parse_args(argv)
+
+    for path in (args.facilities, args.centroids):
+        if not path.exists():
+            print(f"erreur : {path} absent (voir l'en-tête de linkinvet/access.py)", file=sys.stderr)
+            return 1
+    radii = tuple(args.radius or DEFAULT_RADII_KM)
+    try:
+        result = analyse(radii, args.facilities, args.centroids)
+    except ValueError as exc:
+        print(f"erreur : {exc}", file=sys.stderr)
+        return 1
+
+    print(summarize(result, radii).round(1).to_string(index=False))
+    if args.out:
+        args.out.parent.mkdir(parents=True, exist_ok=True)
+        result.to_csv(args.out, index=False)
+        print(f"{len(result)} centroïdes -> {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,209 @@
+# API JSON locale — mêmes indicateurs que dashboard.py (Officiel / Indicateur dérivé / Scénario),
+# servis depuis la couche de données en cache du processus, sans passer par l'interface Streamlit.
+#
+#   python -m linkinvet.api --port 8502                        # processus dédié (sidecar)
+#   python -m linkinvet.serve --api-port 8502 [options...]      # même processus que le tableau de bord
+#
+#   GET /v1/version
+#   GET /v1/facts?indicator=vets_active&jurisdiction=QC&period=2023-24
+#   GET /v1/cvma/national
+#   GET /v1/cvma/provinces
+#   GET /v1/omvq/practice
+#   GET /v1/scenario?juris=QC&solo_share=20&vets_per_solo=1
+#   GET /v1/scenario/grid?vets_per_solo=1
+#
+# Chaque réponse porte un ETag (empreinte du corps) et Cache-Control ; If-None-Match -> 304.
+
+import argparse
+import hashlib
+import json
+import math
+import sys
+import threading
+import traceback
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+from linkinvet import data, scenario
+
+CACHE_CONTROL = "public, max-age=300"
+
+
+class BadRequest(ValueError):
+    pass
+
+
+def _records(df) -> list[dict]:
+    """Lignes JSON d'un DataFrame (NaN -> null)."""
+    return df.astype(object).where(df.notna(), None).to_dict(orient="records")
+
+
+def _finite(value) -> float | None:
+    """Scalaire JSON (NaN / ±inf -> null)."""
+    value = float(value)
+    return value if math.isfinite(value) else None
+
+
+def _juris_label(value: str) -> str:
+    # Seules les juridictions présentes dans df_ca ont un scénario (pas de ligne nationale "CA").
+    available = set(data.get_df_ca()["Juridiction"])
+    labels = {code: label for code, label in data.jurisdiction_labels().items() if label in available}
+    if value in labels:
+        return labels[value]
+    if value in available:
+        return value
+    raise BadRequest(f"juridiction inconnue : {value!r} (codes : {', '.join(labels)})")
+
+
+def _float(params: dict, name: str, default: float, low: float, high: float) -> float:
+    try:
+        value = float(params.get(name, default))
+    except ValueError:
+        raise BadRequest(f"{name} doit être un nombre") from None
+    if not low <= value <= high:
+        raise BadRequest(f"{name} doit être compris entre {low:g} et {high:g}")
+    return value
+
+
+def version(params: dict) -> dict:
+    return {"dataset_version": data.dataset_version()}
+
+
+def facts(params: dict) -> dict:
+    df = data.get_facts()
+    for column in ("indicator", "jurisdiction", "period", "status"):
+        if column in params:
+            df = df[df[column] == params[column]]
+    return {"facts": _records(df)}
+
+
+def cvma_national(params: dict) -> dict:
+    period = data.CVMA_SNAPSHOT_PERIOD
+    official = {
+        name: data.fact(name, "CA", period)
+        for name in (
+            "vets_active", "facilities_accredited",
+            "output_total_mcad", "gdp_total_mcad", "employment_total_fte",
+            "tax_federal_mcad", "tax_provincial_mcad", "tax_municipal_mcad",
+        )
+    }
+    official["vets_registered"] = data.fact("vets_registered", "CA")
+    derived = {
+        "ratio_vets_per_facility": data.derived("can_ratio"),
+        "tax_total_mcad": data.derived("can_tax_total"),
+    }
+    return {"period": period, "Officiel": official, "Dérivé": derived}
+
+
+def cvma_provinces(params: dict) -> dict:
+    return {"period": data.CVMA_SNAPSHOT_PERIOD, "provinces": _records(data.get_df_ca())}
+
+
+def omvq_practice(params: dict) -> dict:
+    return {"practice_main": _records(data.get_qc_practice_main())}
+
+
+def scenario_point(params: dict) -> dict:
+    juris = _juris_label(params.get("juris", scenario.DEFAULT_JURIS))
+    solo_share = _float(params, "solo_share", scenario.DEFAULT_SOLO_SHARE, 0, 100)
+    vets_per_solo = _float(params, "vets_per_solo", scenario.DEFAULT_VETS_PER_SOLO, 0, 10)
+    res = scenario.scenario_point(juris, solo_share, vets_per_solo)
+    return {
+        "juris": juris,
+        "Officiel": {"vets_active": res["vets"], "facilities_accredited": res["facs"]},
+        "Dérivé": {"ratio_vets_per_facility": _finite(res["ratio"])},
+        "Scénario": {
+            "hypotheses": {"solo_share_pct": solo_share, "vets_per_solo": vets_per_solo},
+            # multi_ratio_est est indéfini (null) à 100 % de solo : aucun établissement multi
+            **{name: _finite(res[name]) for name in ("solo_facilities", "multi_facilities", "solo_vets_est", "multi_vets_est", "multi_ratio_est")},
+        },
+    }
+
+
+def scenario_grid(params: dict) -> dict:
+    vets_per_solo = _float(params, "vets_per_solo", scenario.DEFAULT_VETS_PER_SOLO, 0, 10)
+    return {"status": "Scénario", "grid": _records(scenario.scenario_grid(vets_per_solo=vets_per_solo))}
+
+
+ROUTES = {
+    "/v1/version": (version, "no-cache"),
+    "/v1/facts": (facts, CACHE_CONTROL),
+    "/v1/cvma/national": (cvma_national, CACHE_CONTROL),
+    "/v1/cvma/provinces": (cvma_provinces, CACHE_CONTROL),
+    "/v1/omvq/practice": (omvq_practice, CACHE_CONTROL),
+    "/v1/scenario": (scenario_point, CACHE_CONTROL),
+    "/v1/scenario/grid": (scenario_grid, CACHE_CONTROL),
+}
+
+
+@lru_cache(maxsize=512)
+def _render(version_: str, path: str, query: tuple) -> tuple[bytes, str]:
+    """Corps JSON + ETag, mémoïsés par (version des données, route, paramètres triés)."""
+    handler, _ = ROUTES[path]
+    body = json.dumps(handler(dict(query)), ensure_ascii=False, allow_nan=False).encode("utf-8")
+    return body, '"' + hashlib.sha256(body).hexdigest()[:20] + '"'
+
+
+class Handler(BaseHTTPRequestHandler):
+    server_version = "linkinvet-api"
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if url.path not in ROUTES:
+            return self._send(404, json.dumps({"error": f"route inconnue : {url.path}"}).encode("utf-8"))
+        query = tuple(sorted(parse_qsl(url.query)))
+        try:
+            body, etag = _render(data.dataset_version(), url.path, query)
+        except BadRequest as exc:
+            return self._send(400, json.dumps({"error": str(exc)}, ensure_ascii=False).encode("utf-8"))
+        except Exception:
+            # Toujours une réponse JSON : sans cela, le client ne voit qu'une connexion fermée.
+            print(f"linkinvet API : erreur sur {self.path}", file=sys.stderr)
+            traceback.print_exc()
+            return self._send(500, json.dumps({"error": "erreur interne"}, ensure_ascii=False).encode("utf-8"))
+
+        headers = {"ETag": etag, "Cache-Control": ROUTES[url.path][1]}
+        if etag in (tag.strip() for tag in self.headers.get("If-None-Match", "").split(",")):
+            return self._send(304, b"", headers)
+        self._send(200, body, headers)
+
+    def _send(self, status: int, body: bytes, headers: dict | None = None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if status != 304:
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if status != 304:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_in_thread(host: str, port: int) -> ThreadingHTTPServer:
+    """Démarre l'API dans un thread démon (mode "même processus" que Streamlit)."""
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, name="linkinvet-api", daemon=True).start()
+    return server
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(prog="python -m linkinvet.api")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8502)
+    args = parser.parse_args(argv)
+
+    server = ThreadingHTTPServer((args.host, args.port), Handler)
+    print(f"linkinvet API : http://{args.host}:{args.port}/v1/version", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,142 @@
+# Banc de mesure des reruns de dashboard.py, piloté sans navigateur par streamlit.testing (AppTest).
+#
+#   python -m linkinvet.bench                      # mesure et compare à bench/baseline.json
+#   python -m linkinvet.bench --update-baseline    # enregistre les mesures comme nouvelle référence
+#   python -m linkinvet.bench --threshold 0.30     # tolérance de régression (défaut : +20 %)
+#
+# Pour chaque interaction : temps d'horloge (médiane des répétitions), pic mémoire Python (tracemalloc)
+# et taille sérialisée des éléments affichés (somme des protobufs de at.main / at.sidebar — approximation
+# de la charge envoyée au navigateur). Le temps et le pic mémoire viennent de sessions distinctes :
+# tracemalloc ralentit fortement l'exécution et fausserait le temps mesuré. Le démarrage à froid n'a
+# pas de pic mémoire (une seule exécution à froid par processus, réservée au temps).
+# AppTest réexécute le script complet à chaque interaction, y compris pour les widgets placés dans un
+# st.fragment : les chiffres sont donc des bornes hautes.
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+from streamlit.testing.v1 import AppTest
+
+ROOT = Path(__file__).resolve().parent.parent
+APP_PATH = ROOT / "dashboard.py"
+BASELINE_PATH = ROOT / "bench" / "baseline.json"
+
+SCENARIO_VIEW = "Scénarios (estimation)"
+SWEEP_SOLO_SHARES = tuple(range(0, 81, 5))
+SWEEP_JURIS = ("Ontario (ON)", "Alberta (AB)", "Yukon (YK)", "Québec (QC)")
+METRICS = ("wall_ms", "peak_kib", "payload_bytes")
+
+
+def payload_bytes(node) -> int:
+    """Taille sérialisée (octets) des protobufs d'un nœud de l'arbre AppTest et de ses descendants."""
+    proto = getattr(node, "proto", None)
+    size = proto.ByteSize() if hasattr(proto, "ByteSize") else 0
+    for child in getattr(node, "children", {}).values():
+        size += payload_bytes(child)
+    return size
+
+
+def measure(action, trace_memory: bool = False) -> dict:
+    """Exécute une interaction (callable renvoyant l'AppTest après .run()) et en relève les coûts.
+
+    Sans traçage : wall_ms et payload_bytes ; avec trace_memory : peak_kib seulement.
+    """
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    at = action()
+    wall_ms = (time.perf_counter() - start) * 1000
+    if trace_memory:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    if at.exception:
+        raise RuntimeError(f"exception dans le script : {at.exception[0].value}")
+    if trace_memory:
+        return {"peak_kib": peak / 1024}
+    return {"wall_ms": wall_ms, "payload_bytes": payload_bytes(at.main) + payload_bytes(at.sidebar)}
+
+
+def run_session(trace_memory: bool = False) -> dict[str, list[dict]]:
+    """Une session : chargement initial, vue Scénarios, changements de juridiction, balayage du curseur."""
+    samples = {"initial_load": [], "switch_view": [], "switch_juris": [], "sweep_solo_share": []}
+    at = AppTest.from_file(str(APP_PATH), default_timeout=60)
+
+    samples["initial_load"].append(measure(at.run, trace_memory))
+    samples["switch_view"].append(measure(lambda: at.radio(key="view").set_value(SCENARIO_VIEW).run(), trace_memory))
+    for juris in SWEEP_JURIS:
+        samples["switch_juris"].append(measure(lambda: at.selectbox(key="widget_juris").set_value(juris).run(), trace_memory))
+    for share in SWEEP_SOLO_SHARES:
+        samples["sweep_solo_share"].append(measure(lambda: at.slider(key="widget_solo_share").set_value(share).run(), trace_memory))
+    return samples
+
+
+def summarize(sessions: list[dict[str, list[dict]]]) -> dict:
+    """Médiane par interaction et par métrique, toutes sessions confondues (passes temps et mémoire)."""
+    summary = {}
+    for name in sessions[0]:
+        flat = [s for session in sessions for s in session[name]]
+        summary[name] = {
+            metric: round(statistics.median(s[metric] for s in flat if metric in s), 2)
+            for metric in METRICS
+            if any(metric in s for s in flat)
+        }
+    return summary
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list[str]:
+    """Régressions au-delà du seuil relatif (ex. 0.20 = +20 %) par rapport à la référence."""
+    regressions = []
+    for name, metrics in current.items():
+        for metric, value in metrics.items():
+            ref = baseline.get(name, {}).get(metric)
+            if ref and value > ref * (1 + threshold):
+                regressions.append(f"{name}.{metric} : {value:g} (référence {ref:g}, +{(value / ref - 1) * 100:.0f} %)")
+    return regressions
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(prog="python -m linkinvet.bench")
+    parser.add_argument("--sessions", type=int, default=3, help="sessions mesurées (défaut : 3)")
+    parser.add_argument("--threshold", type=float, default=0.20, help="tolérance de régression relative")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    # Premier chargement à froid (caches de processus vides), mesuré à part.
+    cold = measure(AppTest.from_file(str(APP_PATH), default_timeout=60).run)
+    summary = {"cold_start": {metric: round(value, 2) for metric, value in cold.items()}}
+    timed = [run_session() for _ in range(args.sessions)]
+    traced = [run_session(trace_memory=True) for _ in range(args.sessions)]
+    summary.update(summarize(timed + traced))
+
+    print(f"{'interaction':<20}" + "".join(f"{m:>16}" for m in METRICS))
+    for name, metrics in summary.items():
+        print(f"{name:<20}" + "".join(f"{metrics[m]:>16,.1f}" if m in metrics else f"{'—':>16}" for m in METRICS))
+
+    if args.update_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps({
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "results": summary,
+        }, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+        print(f"référence enregistrée : {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"aucune référence ({args.baseline}) : relancer avec --update-baseline")
+        return 0
+    regressions = compare(summary, json.loads(args.baseline.read_text(encoding="utf-8"))["results"], args.threshold)
+    for line in regressions:
+        print(f"RÉGRESSION {line}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,262 @@
+# Couche de données — construction des tableaux CVMA / OMVQ une seule fois par processus.
+#
+# Les chiffres viennent de la table de faits versionnée (linkinvet/dataset.py, data/facts/*.csv).
+# Les tableaux sont mémoïsés par version du jeu de données (dataset_version) et partagés
+# entre toutes les sessions Streamlit du processus : ils doivent être traités en LECTURE SEULE
+# (toute transformation passe par une copie, ex. sort_values).
+
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from linkinvet import dataset, indicators
+
+# Instantané CVMA affiché dans les vues "Canada" et "Scénarios" (libellés de colonnes inclus).
+CVMA_SNAPSHOT_PERIOD = "2023-24"
+VETS_COLUMN = f"Vétérinaires actifs ({CVMA_SNAPSHOT_PERIOD})"
+FACILITIES_COLUMN = f"Établissements accrédités ({CVMA_SNAPSHOT_PERIOD})"
+
+# Population de référence pour l'instantané CVMA (Statistique Canada, estimations au 1er juillet ;
+# partition data/facts/statcan-population-<année>.csv, indicateur "population").
+POPULATION_PERIOD = "2023"
+POPULATION_COLUMN = f"Population ({POPULATION_PERIOD})"
+
+# Ventilations régionales OMVQ (indicateurs "<préfixe>/<région>") -> colonne du tableau des 17 régions.
+QC_REGION_BREAKDOWNS = {
+    "companion_by_region": "Animaux de compagnie (n)",
+    "large_animals_by_region": "Grands animaux (n)",
+    "equine_by_region": "Équins (n)",
+}
+
+# Indicateurs dérivés ajoutés à df_ca, dans l'ordre des colonnes (registre : linkinvet/indicators.py).
+DF_CA_DERIVED = ("prov_ratio", "prov_vets_per_10k", "prov_facilities_per_100k")
+
+# Évaluateur incrémental partagé : après un rechargement des données, seuls les indicateurs dont
+# une entrée a changé sont recalculés.
+_evaluator = indicators.Evaluator(indicators.REGISTRY)
+
+
+@lru_cache(maxsize=1)
+def _manifest() -> tuple:
+    return tuple(sorted(dataset.manifest().items()))
+
+
+@lru_cache(maxsize=1)
+def dataset_version() -> str:
+    """Empreinte courte du jeu de données ; change dès qu'une partition source change."""
+    return dataset.version_of(dict(_manifest()))
+
+
+@lru_cache(maxsize=4)
+def _facts(version: str) -> pd.DataFrame:
+    return dataset.load_facts(manifest_=dict(_manifest())).to_pandas()
+
+
+@lru_cache(maxsize=4)
+def _fact_index(version: str) -> dict:
+    facts = _facts(version)
+    index = {}
+    for indicator, jurisdiction, period, value in facts[["indicator", "jurisdiction", "period", "value"]].itertuples(index=False):
+        index[(indicator, jurisdiction, period)] = value
+        # Clé sans période -> valeur de la période la plus récente
+        latest = index.get((indicator, jurisdiction, None))
+        if latest is None or period > latest[0]:
+            index[(indicator, jurisdiction, None)] = (period, value)
+    return index
+
+
+@lru_cache(maxsize=4)
+def _jurisdiction_labels(version: str) -> dict:
+    table = dataset.load_jurisdictions().to_pydict()
+    return dict(zip(table["code"], table["label"]))
+
+
+def get_facts() -> pd.DataFrame:
+    """Table de faits complète (format long) — partagée, lecture seule."""
+    return _facts(dataset_version())
+
+
+def jurisdiction_labels() -> dict:
+    """Code de juridiction -> libellé affiché, dans l'ordre du référentiel."""
+    return _jurisdiction_labels(dataset_version())
+
+
+def fact(indicator: str, jurisdiction: str = "CA", period: str | None = None):
+    """Valeur d'un indicateur (période la plus récente si non précisée) ; entier si la valeur est entière."""
+    value = _fact_index(dataset_version())[(indicator, jurisdiction, period)]
+    if period is None:
+        value = value[1]
+    return int(value) if float(value).is_integer() else value
+
+
+def facts_with_prefix(prefix: str, jurisdiction: str, period: str | None = None) -> dict:
+    """Indicateurs ventilés "prefix/catégorie" -> {catégorie: valeur}, dans l'ordre du fichier source."""
+    facts = get_facts()
+    rows = facts[facts["indicator"].str.startswith(prefix + "/") & (facts["jurisdiction"] == jurisdiction)]
+    if period is None and not rows.empty:
+        period = rows["period"].max()
+    rows = rows[rows["period"] == period]
+    return {ind.split("/", 1)[1]: fact(ind, jurisdiction, period) for ind in rows["indicator"]}
+
+
+@lru_cache(maxsize=4)
+def _population_index(version: str, period: str) -> pd.Series:
+    """Code de juridiction -> population de la période (index prêt pour la jointure)."""
+    facts = _facts(version)
+    rows = facts[(facts["indicator"] == "population") & (facts["period"] == period)]
+    return pd.Series(rows["value"].to_numpy(), index=rows["jurisdiction"].to_numpy())
+
+
+@lru_cache(maxsize=4)
+def _official_df_ca(version: str) -> pd.DataFrame:
+    facts = _facts(version)
+    snapshot = facts[
+        facts["indicator"].isin(["vets_active", "facilities_accredited"])
+        & (facts["period"] == CVMA_SNAPSHOT_PERIOD)
+        & (facts["jurisdiction"] != "CA")
+    ]
+    wide = snapshot.pivot(index="jurisdiction", columns="indicator", values="value")
+    labels = _jurisdiction_labels(version)
+    wide = wide.reindex([code for code in labels if code in wide.index])
+
+    df_ca = pd.DataFrame({
+        "Juridiction": [labels[code] for code in wide.index],
+        VETS_COLUMN: wide["vets_active"].astype(int).to_numpy(),
+        FACILITIES_COLUMN: wide["facilities_accredited"].astype(int).to_numpy(),
+        # Officiel (Statistique Canada) ; NaN si la population manque.
+        POPULATION_COLUMN: _population_index(version, POPULATION_PERIOD).reindex(wide.index).to_numpy(dtype=float),
+    })
+    return df_ca
+
+
+def _sources(version: str) -> dict:
+    """Entrées officielles du registre d'indicateurs dérivés, pour une version des données."""
+    index = _fact_index(version)
+    official = _official_df_ca(version)
+    national = {
+        "can_vets_active": "vets_active",
+        "can_facilities": "facilities_accredited",
+        "can_tax_federal": "tax_federal_mcad",
+        "can_tax_provincial": "tax_provincial_mcad",
+        "can_tax_municipal": "tax_municipal_mcad",
+        "can_output_total": "output_total_mcad",
+        "can_output_direct": "output_direct_mcad",
+        "can_gdp_total": "gdp_total_mcad",
+        "can_gdp_direct": "gdp_direct_mcad",
+        "can_employment_total": "employment_total_fte",
+        "can_employment_direct": "employment_direct_fte",
+    }
+    sources = {name: index[(indicator, "CA", CVMA_SNAPSHOT_PERIOD)] for name, indicator in national.items()}
+    sources["prov_vets_active"] = official[VETS_COLUMN].to_numpy()
+    sources["prov_facilities"] = official[FACILITIES_COLUMN].to_numpy()
+    sources["prov_population"] = official[POPULATION_COLUMN].to_numpy()
+    sources["qc_practice_counts"] = np.array(list(facts_with_prefix("practice_main", "QC").values()), dtype=float)
+    sources["qc_members_total"] = index[("members_total", "QC", None)][1]
+    return sources
+
+
+@lru_cache(maxsize=4)
+def _derived(version: str) -> dict:
+    return _evaluator.evaluate(_sources(version))
+
+
+def derived(name: str):
+    """Valeur d'un indicateur dérivé du registre (scalaire ou tableau en lecture seule)."""
+    return _derived(dataset_version())[name]
+
+
+@lru_cache(maxsize=4)
+def _build_df_ca(version: str) -> pd.DataFrame:
+    df_ca = _official_df_ca(version).copy()
+    values = _derived(version)
+    for name in DF_CA_DERIVED:
+        df_ca[indicators.REGISTRY[name].label] = values[name]
+    return df_ca
+
+
+@lru_cache(maxsize=4)
+def _build_qc_practice_main(version: str) -> pd.DataFrame:
+    qc_practice_main = pd.DataFrame(
+        [{"Pratique principale": k, "Effectif": v} for k, v in facts_with_prefix("practice_main", "QC").items()]
+    )
+    qc_practice_main[indicators.REGISTRY["qc_practice_share"].label] = _derived(version)["qc_practice_share"]
+    return qc_practice_main
+
+
+@lru_cache(maxsize=4)
+def _build_cvma_timeseries(version: str) -> pd.DataFrame:
+    facts = _facts(version)
+    rows = facts[facts["indicator"].isin(["vets_active", "facilities_accredited"]) & (facts["jurisdiction"] != "CA")]
+    labels = _jurisdiction_labels(version)
+    periods = sorted(rows["period"].unique())
+    codes = [code for code in labels if code in set(rows["jurisdiction"])]
+
+    # Tableaux larges (juridictions × périodes) : la croissance annuelle est un seul calcul vectoriel.
+    ts = pd.DataFrame({
+        "Code": np.repeat(codes, len(periods)),
+        "Période": np.tile(periods, len(codes)),
+    })
+    for indicator in ("vets_active", "facilities_accredited"):
+        wide = (
+            rows[rows["indicator"] == indicator]
+            .pivot(index="jurisdiction", columns="period", values="value")
+            .reindex(index=codes, columns=periods)
+        )
+        ts[indicator] = wide.to_numpy().ravel()
+        ts[indicator + "_yoy"] = (wide.pct_change(axis=1, fill_method=None) * 100).to_numpy().ravel()
+    ts.insert(0, "Juridiction", ts["Code"].map(labels))
+    return ts.rename(columns={
+        "vets_active": "Vétérinaires actifs",
+        "facilities_accredited": "Établissements accrédités",
+        "vets_active_yoy": "Croissance a/a — vétérinaires (%)",
+        "facilities_accredited_yoy": "Croissance a/a — établissements (%)",
+    })
+
+
+@lru_cache(maxsize=4)
+def _build_qc_regions(version: str) -> pd.DataFrame:
+    regions = dataset.load_qc_regions().to_pydict()
+    qc_regions = pd.DataFrame({"Code": regions["code"], "Région administrative": regions["region"]})
+    # Une colonne par ventilation chargée ; NaN pour les régions non publiées / non encore ingérées.
+    for prefix, label in QC_REGION_BREAKDOWNS.items():
+        values = facts_with_prefix(prefix, "QC")
+        if values:
+            qc_regions[label] = qc_regions["Région administrative"].map(values).astype(float)
+    return qc_regions
+
+
+def get_df_ca() -> pd.DataFrame:
+    """Tableau provincial CVMA (instantané CVMA_SNAPSHOT_PERIOD) — partagé, lecture seule."""
+    return _build_df_ca(dataset_version())
+
+
+def get_cvma_timeseries() -> pd.DataFrame:
+    """Séries CVMA toutes éditions (juridiction × période, croissance a/a) — partagé, lecture seule."""
+    return _build_cvma_timeseries(dataset_version())
+
+
+def get_qc_practice_main() -> pd.DataFrame:
+    """Pratique principale OMVQ — partagé, lecture seule."""
+    return _build_qc_practice_main(dataset_version())
+
+
+def get_qc_regions() -> pd.DataFrame:
+    """Régions administratives du Québec (17) × ventilations OMVQ chargées — partagé, lecture seule."""
+    return _build_qc_regions(dataset_version())
+
+
+def invalidate() -> None:
+    """Invalidation explicite : à appeler après toute mise à jour de data/facts/."""
+    _manifest.cache_clear()
+    dataset_version.cache_clear()
+    _facts.cache_clear()
+    _fact_index.cache_clear()
+    _jurisdiction_labels.cache_clear()
+    _population_index.cache_clear()
+    _official_df_ca.cache_clear()
+    _derived.cache_clear()
+    _build_df_ca.cache_clear()
+    _build_qc_practice_main.cache_clear()
+    _build_cvma_timeseries.cache_clear()
+    _build_qc_regions.cache_clear()
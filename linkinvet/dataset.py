@@ -0,0 +1,213 @@
+# Jeu de données versionné — table de faits au format long, une partition par édition de rapport.
+#
+# Source de vérité (éditable, lisible dans un diff) : data/facts/<source>-<période>.csv
+#   indicator, jurisdiction, period, source, value, status (Officiel / Dérivé / Scénario)
+# Chaque partition est compilée en Arrow IPC (data/facts/_compiled/*.arrow) à la première lecture,
+# puis mappée en mémoire : seules les colonnes demandées sont matérialisées.
+#
+# Ajouter une année ou une région = ajouter des lignes ou une partition CSV, sans modifier le code.
+#
+#   python -m linkinvet.dataset build                      # (re)compile les partitions modifiées
+#   python -m linkinvet.dataset info                       # version, partitions, nombre de lignes
+#   python -m linkinvet.dataset ingest edition.csv --name cvma-2024-25
+#       # ajoute une édition : seule la nouvelle partition est validée et compilée
+
+import argparse
+import hashlib
+import os
+import shutil
+import sys
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.ipc as pa_ipc
+
+DATA_DIR = Path(os.environ.get("LINKINVET_DATA_DIR", Path(__file__).resolve().parent.parent / "data"))
+FACTS_DIR = DATA_DIR / "facts"
+COMPILED_DIR = FACTS_DIR / "_compiled"
+JURISDICTIONS_CSV = DATA_DIR / "jurisdictions.csv"
+QC_REGIONS_CSV = DATA_DIR / "qc_regions.csv"
+
+FACT_COLUMNS = ("indicator", "jurisdiction", "period", "source", "value", "status")
+FACT_SCHEMA = pa.schema([
+    ("indicator", pa.string()),
+    ("jurisdiction", pa.string()),
+    ("period", pa.string()),
+    ("source", pa.string()),
+    ("value", pa.float64()),
+    ("status", pa.string()),
+])
+STATUSES = ("Officiel", "Dérivé", "Scénario")
+
+_SOURCE_HASH_KEY = b"linkinvet.source_sha256"
+
+
+def partitions() -> list[Path]:
+    """Partitions CSV présentes, dans un ordre stable."""
+    return sorted(FACTS_DIR.glob("*.csv"))
+
+
+def file_sha256(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def manifest() -> dict[str, str]:
+    """Nom de partition -> empreinte SHA-256 du CSV."""
+    return {p.name: file_sha256(p) for p in partitions()}
+
+
+def version_of(manifest_: dict[str, str]) -> str:
+    """Version courte du jeu de données : empreinte des empreintes de partitions."""
+    h = hashlib.sha256()
+    for name, digest in sorted(manifest_.items()):
+        h.update(f"{name}:{digest}\n".encode("utf-8"))
+    for reference in (JURISDICTIONS_CSV, QC_REGIONS_CSV):
+        if reference.exists():
+            h.update(file_sha256(reference).encode("ascii"))
+    return h.hexdigest()[:12]
+
+
+def _read_csv(path: Path) -> pa.Table:
+    table = pa_csv.read_csv(
+        path,
+        convert_options=pa_csv.ConvertOptions(
+            column_types=FACT_SCHEMA,
+            include_columns=list(FACT_COLUMNS),
+        ),
+    )
+    bad = set(table.column("status").to_pylist()) - set(STATUSES)
+    if bad:
+        raise ValueError(f"{path.name} : statut(s) inconnu(s) {sorted(bad)} (attendus : {', '.join(STATUSES)})")
+    return table
+
+
+def _compiled_path(csv_path: Path) -> Path:
+    return COMPILED_DIR / (csv_path.stem + ".arrow")
+
+
+def _compiled_hash(arrow_path: Path) -> str | None:
+    try:
+        with pa.memory_map(str(arrow_path)) as source:
+            metadata = pa_ipc.open_file(source).schema.metadata or {}
+    except (OSError, pa.ArrowInvalid):
+        return None
+    value = metadata.get(_SOURCE_HASH_KEY)
+    return value.decode("ascii") if value else None
+
+
+def compile_partition(csv_path: Path, digest: str | None = None) -> Path:
+    """Compile une partition CSV en Arrow IPC (écriture atomique), sauf si elle est déjà à jour."""
+    digest = digest or file_sha256(csv_path)
+    arrow_path = _compiled_path(csv_path)
+    if _compiled_hash(arrow_path) == digest:
+        return arrow_path
+
+    table = _read_csv(csv_path)
+    table = table.replace_schema_metadata({_SOURCE_HASH_KEY: digest.encode("ascii")})
+    COMPILED_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = arrow_path.with_suffix(f".{os.getpid()}.tmp")
+    with pa_ipc.new_file(str(tmp), table.schema) as writer:
+        writer.write_table(table)
+    os.replace(tmp, arrow_path)
+    return arrow_path
+
+
+def _open_partition(csv_path: Path, digest: str, columns: list[str]) -> pa.Table:
+    try:
+        arrow_path = compile_partition(csv_path, digest)
+    except OSError:
+        # Système de fichiers en lecture seule : lecture directe du CSV.
+        return _read_csv(csv_path).select(columns)
+    source = pa.memory_map(str(arrow_path))
+    return pa_ipc.open_file(source).read_all().select(columns)
+
+
+def load_facts(columns=FACT_COLUMNS, manifest_: dict[str, str] | None = None) -> pa.Table:
+    """Table de faits complète (toutes partitions), limitée aux colonnes demandées."""
+    manifest_ = manifest() if manifest_ is None else manifest_
+    columns = list(columns)
+    tables = [_open_partition(FACTS_DIR / name, digest, columns) for name, digest in sorted(manifest_.items())]
+    if not tables:
+        return FACT_SCHEMA.empty_table().select(columns)
+    return pa.concat_tables(tables)
+
+
+def load_jurisdictions() -> pa.Table:
+    """Référentiel des juridictions (code, libellé), dans l'ordre d'affichage."""
+    return pa_csv.read_csv(JURISDICTIONS_CSV)
+
+
+def load_qc_regions() -> pa.Table:
+    """Régions administratives du Québec (code 01–17, nom), dans l'ordre officiel."""
+    return pa_csv.read_csv(QC_REGIONS_CSV, convert_options=pa_csv.ConvertOptions(column_types={"code": pa.string()}))
+
+
+def ingest(csv_path: Path, name: str, replace: bool = False) -> Path:
+    """Ajoute une édition comme nouvelle partition, sans relire ni recompiler les partitions existantes.
+
+    Refuse les doublons (indicator, jurisdiction, period) déjà présents dans une autre partition, et un
+    remplacement qui retirerait des valeurs (indicator, jurisdiction) de la partition remplacée.
+    """
+    target = FACTS_DIR / f"{name}.csv"
+    if target.exists() and not replace:
+        raise FileExistsError(f"La partition {target.name} existe déjà (utiliser --replace).")
+
+    new = _read_csv(csv_path)
+    new_keys = set(zip(*(new.column(c).to_pylist() for c in ("indicator", "jurisdiction", "period"))))
+    if len(new_keys) != new.num_rows:
+        raise ValueError(f"{csv_path} : clés (indicator, jurisdiction, period) en double.")
+    if target.exists():
+        old = _read_csv(target)
+        dropped = set(zip(old.column("indicator").to_pylist(), old.column("jurisdiction").to_pylist())) - {
+            (indicator, jurisdiction) for indicator, jurisdiction, _ in new_keys
+        }
+        if dropped:
+            sample = ", ".join("/".join(k) for k in sorted(dropped)[:5])
+            raise ValueError(f"Le remplacement de {target.name} retirerait {len(dropped)} valeur(s) : {sample}")
+
+    key_columns = ["indicator", "jurisdiction", "period"]
+    others = {n: d for n, d in manifest().items() if n != target.name}
+    existing = load_facts(key_columns, others)
+    overlap = new_keys & set(zip(*(existing.column(c).to_pylist() for c in key_columns)))
+    if overlap:
+        sample = ", ".join("/".join(k) for k in sorted(overlap)[:5])
+        raise ValueError(f"{len(overlap)} valeur(s) déjà présente(s) dans une autre partition : {sample}")
+
+    FACTS_DIR.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(csv_path, target)
+    compile_partition(target)
+    return target
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(prog="python -m linkinvet.dataset")
+    sub = parser.add_subparsers(dest="command")
+    sub.add_parser("info")
+    sub.add_parser("build")
+    p_ingest = sub.add_parser("ingest", help="ajouter une édition (nouvelle partition)")
+    p_ingest.add_argument("csv", type=Path)
+    p_ingest.add_argument("--name", required=True, help="nom de partition, ex. cvma-2024-25")
+    p_ingest.add_argument("--replace", action="store_true", help="remplacer une partition existante du même nom")
+    args = parser.parse_args(argv)
+
+    if args.command == "ingest":
+        try:
+            target = ingest(args.csv, args.name, args.replace)
+        except (FileExistsError, ValueError) as exc:
+            print(f"erreur : {exc}", file=sys.stderr)
+            return 1
+        print(f"{args.csv} -> {target.relative_to(DATA_DIR)}")
+
+    manifest_ = manifest()
+    if args.command == "build":
+        for name, digest in sorted(manifest_.items()):
+            print(f"{name} -> {compile_partition(FACTS_DIR / name, digest).relative_to(DATA_DIR)}")
+    print(f"version : {version_of(manifest_)}")
+    for name in sorted(manifest_):
+        print(f"  {name} : {_read_csv(FACTS_DIR / name).num_rows} lignes")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,129 @@
+# Export statique du tableau de bord (présentations aux partenaires financiers) : HTML, PNG et PDF combiné.
+#
+#   python -m linkinvet.export --out export/
+#   python -m linkinvet.export --out export/ --formats html,png --workers 4
+#
+# Graphiques exportés : vues Canada et Québec, surface de scénario, puis le scénario de chaque juridiction.
+# Le rendu est réparti sur un pool de processus (chaque processus garde son propre cache de figures).
+# export/manifest.json mémorise la version des données : une relance sans changement de données ne
+# refait que les fichiers manquants (--force pour tout refaire).
+#
+# PNG / PDF : kaleido (requirements-tools.txt). Le PDF assemble les PNG avec Pillow (dépendance de Streamlit).
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+FORMATS = ("html", "png", "pdf")
+PNG_SCALE = 2
+PDF_NAME = "linkinvet_tableau_de_bord.pdf"
+
+
+def export_tasks() -> list[tuple[str, str | None]]:
+    """(identifiant de graphique, juridiction) dans l'ordre du document."""
+    from linkinvet import data, figures
+
+    tasks = [("ca_vets", None), ("ca_facilities", None), ("ca_ratio", None)]
+    tasks += [("ca_vets_per_10k", None), ("ca_facilities_per_100k", None)]
+    if data.get_cvma_timeseries()["Période"].nunique() > 1:
+        tasks += [("ca_ts_vets", None), ("ca_ts_vets_yoy", None)]
+    tasks += [("qc_practice", None), ("scen_heatmap", None)]
+    tasks += [(chart_id, None) for chart_id in ("qc_regions_map", "ca_map_high") if figures.available(chart_id)]
+    tasks += [("scen_juris", juris) for juris in data.get_df_ca()["Juridiction"]]
+    return tasks
+
+
+def file_stem(chart_id: str, juris: str | None) -> str:
+    if juris is None:
+        return chart_id
+    code = juris.rsplit("(", 1)[-1].rstrip(")")
+    return f"{chart_id}_{code}"
+
+
+def _render(task: tuple[str, str | None], out_dir: str, formats: tuple, force: bool) -> tuple[str, list[str]]:
+    """Processus de travail : écrit les fichiers d'un graphique ; renvoie (nom de base, fichiers écrits)."""
+    from linkinvet.figures import get_figure
+
+    chart_id, juris = task
+    stem = file_stem(chart_id, juris)
+    out = Path(out_dir)
+    targets = {"html": out / "html" / f"{stem}.html", "png": out / "png" / f"{stem}.png"}
+    wanted = [fmt for fmt in ("html", "png") if fmt in formats or (fmt == "png" and "pdf" in formats)]
+    todo = [fmt for fmt in wanted if force or not targets[fmt].exists()]
+    if not todo:
+        return stem, []
+
+    fig = get_figure(chart_id, juris).figure
+    written = []
+    for fmt in todo:
+        targets[fmt].parent.mkdir(parents=True, exist_ok=True)
+        if fmt == "html":
+            # plotly.min.js écrit une seule fois dans html/, partagé par toutes les pages
+            fig.write_html(targets[fmt], include_plotlyjs="directory", full_html=True)
+        else:
+            targets[fmt].write_bytes(fig.to_image(format="png", scale=PNG_SCALE))
+        written.append(str(targets[fmt]))
+    return stem, written
+
+
+def write_pdf(png_paths: list[Path], pdf_path: Path) -> None:
+    from PIL import Image
+
+    pages = [Image.open(path).convert("RGB") for path in png_paths]
+    pages[0].save(pdf_path, save_all=True, append_images=pages[1:], resolution=72.0 * PNG_SCALE)
+
+
+def write_index(out: Path, stems: list[str]) -> None:
+    links = "\n".join(f'<li><a href="html/{stem}.html">{stem}</a></li>' for stem in stems)
+    (out / "index.html").write_text(
+        f"<!doctype html><meta charset='utf-8'><title>LinkinVet — export</title><ul>\n{links}\n</ul>\n",
+        encoding="utf-8",
+    )
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(prog="python -m linkinvet.export")
+    parser.add_argument("--out", type=Path, default=Path("export"))
+    parser.add_argument("--formats", default=",".join(FORMATS), help="parmi html,png,pdf")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--force", action="store_true", help="tout refaire, même si les données n'ont pas changé")
+    args = parser.parse_args(argv)
+
+    formats = tuple(f.strip() for f in args.formats.split(",") if f.strip())
+    unknown = set(formats) - set(FORMATS)
+    if unknown:
+        parser.error(f"format(s) inconnu(s) : {', '.join(sorted(unknown))}")
+
+    from linkinvet.data import dataset_version
+
+    out = args.out
+    out.mkdir(parents=True, exist_ok=True)
+    manifest_path = out / "manifest.json"
+    version = dataset_version()
+    previous = json.loads(manifest_path.read_text(encoding="utf-8")) if manifest_path.exists() else {}
+    force = args.force or previous.get("dataset_version") != version
+
+    start = time.perf_counter()
+    tasks = export_tasks()
+    with ProcessPoolExecutor(max_workers=max(1, min(args.workers, len(tasks)))) as pool:
+        results = list(pool.map(_render, tasks, [str(out)] * len(tasks), [formats] * len(tasks), [force] * len(tasks)))
+    stems = [stem for stem, _ in results]
+    n_written = sum(len(written) for _, written in results)
+
+    if "html" in formats:
+        write_index(out, stems)
+    if "pdf" in formats:
+        write_pdf([out / "png" / f"{stem}.png" for stem in stems], out / PDF_NAME)
+
+    manifest_path.write_text(json.dumps({"dataset_version": version, "charts": stems, "formats": list(formats)},
+                                        indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    print(f"{len(stems)} graphiques, {n_written} fichier(s) écrit(s) en {time.perf_counter() - start:.1f} s -> {out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
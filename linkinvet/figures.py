@@ -0,0 +1,282 @@
+# Cache des figures Plotly — chaque graphique est construit une seule fois par version du jeu de données
+# et partagé (objet Figure) entre toutes les sessions du processus. La sérialisation JSON n'est pas mise
+# en cache : st.plotly_chart resérialise la figure à chaque affichage (pas d'API pour lui passer un JSON).
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from linkinvet import geo
+from linkinvet.data import (
+    CVMA_SNAPSHOT_PERIOD,
+    FACILITIES_COLUMN,
+    VETS_COLUMN,
+    dataset_version,
+    get_cvma_timeseries,
+    get_df_ca,
+    get_qc_practice_main,
+    get_qc_regions,
+    jurisdiction_labels,
+)
+from linkinvet.scenario import scenario_grid
+
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+
+# Imports différés : plotly.express est le plus lourd du démarrage (python -m linkinvet.importreport).
+# Ils ne sont payés qu'à la première construction de figure — ou en tâche de fond (linkinvet.warmup).
+def _px():
+    import plotly.express as px
+    return px
+
+
+def _go():
+    import plotly.graph_objects as go
+    return go
+
+
+@dataclass(frozen=True)
+class CachedFigure:
+    figure: go.Figure
+
+
+def _bar_ca(column: str, title: str) -> go.Figure:
+    return _px().bar(
+        get_df_ca().sort_values(column, ascending=False),
+        x="Juridiction",
+        y=column,
+        title=title,
+    )
+
+
+def _scenario_heatmap() -> go.Figure:
+    surface = scenario_grid().pivot(
+        index="Juridiction",
+        columns="Part solo (%)",
+        values="Vétos / établissement multi (estim.)",
+    ).reindex(get_df_ca()["Juridiction"])
+    return _px().imshow(
+        surface,
+        aspect="auto",
+        text_auto=".1f",
+        color_continuous_scale="Blues",
+        labels={"x": "Part solo (%)", "y": "Juridiction", "color": "Vétos / étab. multi"},
+        title="Scénario — vétérinaires par établissement multi selon la part d’établissements solo (estimation)",
+    )
+
+
+def _timeseries(column: str, title: str) -> go.Figure:
+    return _px().line(
+        get_cvma_timeseries(),
+        x="Période",
+        y=column,
+        color="Juridiction",
+        markers=True,
+        title=title,
+    )
+
+
+def _qc_regions_map() -> go.Figure:
+    qc_regions = get_qc_regions()
+    column = "Animaux de compagnie (n)"
+    fig = _px().choropleth(
+        qc_regions,
+        geojson=geo.layer("qc_regions"),
+        locations="Code",
+        featureidkey="properties.code",
+        color=column,
+        hover_name="Région administrative",
+        color_continuous_scale="Blues",
+        title="Médecins vétérinaires — pratique animaux de compagnie, par région administrative (OMVQ)",
+    )
+    fig.update_geos(fitbounds="locations", visible=False)
+    return fig
+
+
+# Colonnes de df_ca proposées sur la carte du Canada (toutes numériques)
+def ca_map_columns() -> list[str]:
+    df_ca = get_df_ca()
+    return [column for column in df_ca.columns if column != "Juridiction"]
+
+
+def _ca_map(level: str) -> go.Figure:
+    """Carte des provinces : une seule trace (géométrie envoyée une fois) ; le choix de l'indicateur
+    se fait dans le navigateur (menu "restyle" qui ne remplace que les valeurs z)."""
+    df_ca = get_df_ca()
+    codes = df_ca["Juridiction"].map({label: code for code, label in jurisdiction_labels().items()})
+    columns = ca_map_columns()
+    go = _go()
+    fig = go.Figure(go.Choropleth(
+        geojson=geo.layer("ca_provinces", level),
+        featureidkey="properties.code",
+        locations=codes,
+        z=df_ca[columns[0]],
+        text=df_ca["Juridiction"],
+        hovertemplate="%{text}<br>%{z:,.2f}<extra></extra>",
+        colorscale="Blues",
+        colorbar={"title": {"text": ""}},
+    ))
+    fig.update_geos(fitbounds="locations", visible=False)
+    fig.update_layout(
+        title=f"Canada — indicateurs CVMA par juridiction ({CVMA_SNAPSHOT_PERIOD})",
+        margin={"l": 0, "r": 0, "t": 80, "b": 0},
+        updatemenus=[{
+            "buttons": [
+                {"label": column, "method": "restyle", "args": [{"z": [df_ca[column].tolist()]}]}
+                for column in columns
+            ],
+            "direction": "down",
+            "x": 0,
+            "xanchor": "left",
+            "y": 1.08,
+            "yanchor": "top",
+        }],
+    )
+    return fig
+
+
+# Identifiant de graphique -> constructeur (sans argument : les données viennent de la couche linkinvet.data)
+FIGURE_BUILDERS = {
+    "ca_vets": lambda: _bar_ca(
+        VETS_COLUMN,
+        f"Vétérinaires actifs par juridiction ({CVMA_SNAPSHOT_PERIOD})",
+    ),
+    "ca_facilities": lambda: _bar_ca(
+        FACILITIES_COLUMN,
+        f"Établissements accrédités par juridiction ({CVMA_SNAPSHOT_PERIOD})",
+    ),
+    "ca_ratio": lambda: _bar_ca(
+        "Ratio (vétos / établissement) — indicateur dérivé",
+        "Ratio vétérinaires actifs / établissements accrédités (proxy de concentration)",
+    ),
+    "ca_vets_per_10k": lambda: _bar_ca(
+        "Vétérinaires / 10 000 hab. — indicateur dérivé",
+        "Vétérinaires actifs pour 10 000 habitants (2023-24 / population 2023)",
+    ),
+    "ca_facilities_per_100k": lambda: _bar_ca(
+        "Établissements / 100 000 hab. — indicateur dérivé",
+        "Établissements accrédités pour 100 000 habitants (2023-24 / population 2023)",
+    ),
+    "qc_practice": lambda: _px().bar(
+        get_qc_practice_main().sort_values("Effectif", ascending=False),
+        x="Pratique principale",
+        y="Effectif",
+        title="Répartition des pratiques principales (effectifs)",
+    ),
+    "ca_ts_vets": lambda: _timeseries(
+        "Vétérinaires actifs",
+        "Vétérinaires actifs par juridiction — toutes éditions CVMA",
+    ),
+    "ca_ts_vets_yoy": lambda: _timeseries(
+        "Croissance a/a — vétérinaires (%)",
+        "Croissance annuelle des vétérinaires actifs (%) — indicateur dérivé",
+    ),
+    "scen_heatmap": _scenario_heatmap,
+    "qc_regions_map": _qc_regions_map,
+    # Carte du Canada, un graphique par niveau de détail géométrique (linkinvet.geo.LEVELS)
+    **{f"ca_map_{level}": (lambda level=level: _ca_map(level)) for level in geo.LEVELS},
+}
+
+# Graphiques qui dépendent d'une couche géographique locale (data/geo/, linkinvet.geo)
+FIGURE_GEO_LAYERS = {
+    "qc_regions_map": "qc_regions",
+    **{f"ca_map_{level}": "ca_provinces" for level in geo.LEVELS},
+}
+
+
+def available(chart_id: str) -> bool:
+    """Faux si le graphique dépend d'une couche géographique absente."""
+    layer = FIGURE_GEO_LAYERS.get(chart_id)
+    return layer is None or geo.available(layer)
+
+
+def _scenario_jurisdiction(juris: str) -> go.Figure:
+    grid = scenario_grid()
+    return _px().bar(
+        grid[grid["Juridiction"] == juris],
+        x="Part solo (%)",
+        y=["Vétérinaires 'solo' (estim.)", "Vétérinaires en structure multi (estim.)"],
+        labels={"value": "Vétérinaires (estim.)", "variable": ""},
+        title=f"Scénario — {juris} : vétérinaires 'solo' / multi selon la part d’établissements solo (estimation)",
+    )
+
+
+# Graphiques déclinés par juridiction : identifiant -> constructeur(juridiction)
+JURIS_FIGURE_BUILDERS = {
+    "scen_juris": _scenario_jurisdiction,
+}
+
+_lock = threading.Lock()
+_cache: dict[tuple, CachedFigure] = {}
+_stats = {"hits": 0, "misses": 0}
+
+
+def get_figure(chart_id: str, juris: str | None = None) -> CachedFigure:
+    """Figure mise en cache pour la version courante des données (construite au premier appel).
+
+    juris : juridiction, pour les graphiques de JURIS_FIGURE_BUILDERS.
+    """
+    key = (chart_id, juris, dataset_version())
+    with _lock:
+        cached = _cache.get(key)
+        if cached is not None:
+            _stats["hits"] += 1
+            return cached
+        _stats["misses"] += 1
+
+    fig = FIGURE_BUILDERS[chart_id]() if juris is None else JURIS_FIGURE_BUILDERS[chart_id](juris)
+    cached = CachedFigure(figure=fig)
+    with _lock:
+        # Nouvelle version des données : les figures des versions précédentes ne seront plus servies.
+        for stale in [k for k in _cache if k[2] != key[2]]:
+            del _cache[stale]
+        # En cas de construction concurrente, la première entrée enregistrée est conservée.
+        return _cache.setdefault(key, cached)
+
+
+def cache_stats() -> dict:
+    """Compteurs du cache (succès / échecs, entrées)."""
+    with _lock:
+        return {
+            "hits": _stats["hits"],
+            "misses": _stats["misses"],
+            "entries": len(_cache),
+        }
+
+
+def clear() -> None:
+    with _lock:
+        _cache.clear()
+
+
+def projection_figure(table, title: str) -> go.Figure:
+    """Projection d'effectif (dépend des curseurs : non mise en cache, la table l'est — linkinvet.workforce)."""
+    return _px().line(table, x="Année", y="Effectif (estim.)", color="Juridiction", title=title)
+
+
+def tornado_figure(table, title: str, pct: float) -> go.Figure:
+    """Diagramme en tornade (une juridiction, un indicateur) : barres de la base vers -pct / +pct.
+
+    pct s'entend en % pour les valeurs et en points de % pour la part solo (linkinvet.scenario).
+    """
+    table = table.sort_values("Amplitude")
+    go = _go()
+    base = table["Base"].to_numpy()
+    fig = go.Figure([
+        go.Bar(y=table["Hypothèse"], x=table["Bas"] - base, base=base, orientation="h", name=f"-{pct:g}"),
+        go.Bar(y=table["Hypothèse"], x=table["Haut"] - base, base=base, orientation="h", name=f"+{pct:g}"),
+    ])
+    fig.update_layout(title=title, barmode="overlay", xaxis_title=table["Indicateur"].iloc[0], yaxis_title="")
+    return fig
+
+
+def histogram_figure(edges, counts, title: str, x_label: str) -> go.Figure:
+    """Histogramme pré-agrégé (bornes + effectifs) : seules les classes sont envoyées au navigateur."""
+    centers = (edges[:-1] + edges[1:]) / 2
+    go = _go()
+    fig = go.Figure(go.Bar(x=centers, y=counts, width=edges[1:] - edges[:-1]))
+    fig.update_layout(title=title, xaxis_title=x_label, yaxis_title="Tirages", bargap=0)
+    return fig
@@ -0,0 +1,200 @@
+# Géométries des cartes (choroplèthes) — fichiers GeoJSON locaux, simplifiés une fois puis mis en cache.
+#
+# Fichiers attendus dans data/geo/ (non versionnés : à télécharger une fois, voir LAYERS), en WGS84 (EPSG:4326) :
+#   qc_regions.geojson    — régions administratives du Québec (MRNF, « Découpages administratifs »,
+#                           propriété RES_CO_REG = code 01–17)
+#   ca_provinces.geojson  — provinces et territoires (Statistique Canada, fichier des limites cartographiques
+#                           du Recensement 2021, propriété PRUID), reprojeté en WGS84
+#
+# Simplification Douglas–Peucker (NumPy) à plusieurs tolérances (niveaux de détail), arrondi des
+# coordonnées, puis écriture dans .cache/geo/ (clé : empreinte du fichier source + tolérance) : les
+# processus suivants relisent la version simplifiée. En mémoire, chaque niveau est chargé une seule fois
+# par processus. Les entités simplifiées ne gardent qu'une propriété : "code" (code du référentiel).
+#
+#   python -m linkinvet.geo                      # couches disponibles, taille avant / après simplification
+
+import hashlib
+import json
+import os
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+from linkinvet import dataset
+
+GEO_DIR = dataset.DATA_DIR / "geo"
+CACHE_DIR = Path(os.environ.get("LINKINVET_CACHE_DIR", Path(__file__).resolve().parent.parent / ".cache")) / "geo"
+
+# À incrémenter si l'algorithme de simplification change (invalide le cache disque).
+SIMPLIFY_VERSION = 2
+# Décimales conservées (4 ≈ 10 m) : réduit la taille du JSON envoyé au navigateur.
+PRECISION = 4
+
+
+# Niveaux de détail : du plus léger (vue d'ensemble) au plus fidèle.
+LEVELS = ("low", "medium", "high")
+DEFAULT_LEVEL = "medium"
+
+
+@dataclass(frozen=True)
+class Layer:
+    filename: str
+    # Propriété GeoJSON source portant l'identifiant
+    id_property: str
+    # Niveau de détail -> tolérance de simplification (degrés)
+    tolerances: dict
+    # Identifiant source -> code du référentiel (data/jurisdictions.csv, data/qc_regions.csv) ; None = identique
+    codes: dict | None = None
+
+
+LAYERS = {
+    "qc_regions": Layer("qc_regions.geojson", "RES_CO_REG", {"low": 0.03, "medium": 0.01, "high": 0.003}),
+    "ca_provinces": Layer(
+        "ca_provinces.geojson",
+        "PRUID",
+        {"low": 0.2, "medium": 0.05, "high": 0.01},
+        codes={
+            "10": "NL", "11": "PE", "12": "NS", "13": "NB", "24": "QC", "35": "ON",
+            "46": "MB", "47": "SK", "48": "AB", "59": "BC", "60": "YK", "61": "NT", "62": "NU",
+        },
+    ),
+}
+
+
+def source_path(name: str) -> Path:
+    return GEO_DIR / LAYERS[name].filename
+
+
+def available(name: str) -> bool:
+    return source_path(name).exists()
+
+
+# -----------------------------
+# Simplification (Douglas–Peucker)
+# -----------------------------
+def simplify_line(points: np.ndarray, tolerance: float) -> np.ndarray:
+    """Points conservés d'une polyligne (n, 2) ; itératif (pile), distances calculées en NumPy."""
+    n = len(points)
+    if n < 3 or tolerance <= 0:
+        return points
+    keep = np.zeros(n, dtype=bool)
+    keep[[0, -1]] = True
+    stack = [(0, n - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        a, b = points[start], points[end]
+        segment = points[start + 1:end]
+        ab = b - a
+        length = np.hypot(*ab)
+        if length == 0:
+            dist = np.hypot(*(segment - a).T)
+        else:
+            dist = np.abs(ab[0] * (segment[:, 1] - a[1]) - ab[1] * (segment[:, 0] - a[0])) / length
+        i = int(np.argmax(dist))
+        if dist[i] > tolerance:
+            mid = start + 1 + i
+            keep[mid] = True
+            stack += [(start, mid), (mid, end)]
+    return points[keep]
+
+
+def _simplify_ring(ring: list, tolerance: float) -> list | None:
+    # Anneau fermé : le premier et le dernier point sont identiques et conservés.
+    points = simplify_line(np.asarray(ring, dtype=float), tolerance)
+    if len(points) < 4:
+        return None
+    return np.round(points, PRECISION).tolist()
+
+
+def _simplify_polygon(rings: list, tolerance: float) -> list | None:
+    exterior = _simplify_ring(rings[0], tolerance)
+    if exterior is None:
+        return None
+    holes = [hole for hole in (_simplify_ring(r, tolerance) for r in rings[1:]) if hole is not None]
+    return [exterior, *holes]
+
+
+def simplify_geometry(geometry: dict, tolerance: float) -> dict | None:
+    """Polygon / MultiPolygon simplifié ; les parties réduites à moins d'un triangle sont retirées."""
+    if geometry["type"] == "Polygon":
+        polygons = [geometry["coordinates"]]
+    elif geometry["type"] == "MultiPolygon":
+        polygons = geometry["coordinates"]
+    else:
+        raise ValueError(f"géométrie non prise en charge : {geometry['type']}")
+    kept = [p for p in (_simplify_polygon(poly, tolerance) for poly in polygons) if p is not None]
+    if not kept:
+        # Petite île ou région : la tolérance est trop forte, on garde la géométrie d'origine.
+        return geometry
+    if len(kept) == 1:
+        return {"type": "Polygon", "coordinates": kept[0]}
+    return {"type": "MultiPolygon", "coordinates": kept}
+
+
+def simplify_collection(collection: dict, tolerance: float, spec: Layer) -> dict:
+    """FeatureCollection réduite : géométrie simplifiée, seule la propriété "code" conservée."""
+    features = []
+    for feature in collection["features"]:
+        raw = str(feature["properties"][spec.id_property])
+        features.append({
+            "type": "Feature",
+            "properties": {"code": spec.codes.get(raw, raw) if spec.codes else raw},
+            "geometry": simplify_geometry(feature["geometry"], tolerance),
+        })
+    return {"type": "FeatureCollection", "features": features}
+
+
+# -----------------------------
+# Cache (disque + processus)
+# -----------------------------
+def _cache_path(name: str, tolerance: float) -> Path:
+    digest = hashlib.sha256(source_path(name).read_bytes()).hexdigest()[:16]
+    return CACHE_DIR / f"{name}-{digest}-{tolerance:g}.v{SIMPLIFY_VERSION}.geojson"
+
+
+@lru_cache(maxsize=16)
+def layer(name: str, level: str = DEFAULT_LEVEL) -> dict:
+    """GeoJSON simplifié d'une couche au niveau de détail demandé — partagé, lecture seule.
+
+    Lève FileNotFoundError si le fichier source n'est pas présent dans data/geo/.
+    """
+    spec = LAYERS[name]
+    tolerance = spec.tolerances[level]
+    if not available(name):
+        raise FileNotFoundError(f"{source_path(name)} absent (voir l'en-tête de linkinvet/geo.py)")
+    cached = _cache_path(name, tolerance)
+    if cached.exists():
+        return json.loads(cached.read_text(encoding="utf-8"))
+
+    collection = json.loads(source_path(name).read_text(encoding="utf-8"))
+    simplified = simplify_collection(collection, tolerance, spec)
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = cached.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(simplified, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, cached)
+    except OSError:
+        pass  # système de fichiers en lecture seule : cache en mémoire seulement
+    return simplified
+
+
+def main(argv: list[str]) -> int:
+    for name in LAYERS:
+        if not available(name):
+            print(f"{name} : absent ({source_path(name)})")
+            continue
+        sizes = ", ".join(
+            f"{level} {len(json.dumps(layer(name, level), separators=(',', ':'))) / 1024:,.0f} Kio"
+            for level in LEVELS
+        )
+        print(f"{name} : source {source_path(name).stat().st_size / 1024:,.0f} Kio -> {sizes}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
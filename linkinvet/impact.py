@@ -0,0 +1,107 @@
+# Moteur d'impact économique (type entrées-sorties) — CVMA, Table 1 (Canada, 2023-24).
+#
+# Multiplicateurs nationaux = impact total (direct + indirect + induit) / impact direct, pour la production,
+# le PIB et les emplois (registre linkinvet.indicators). Les impacts directs nationaux sont répartis entre
+# juridictions au prorata des vétérinaires actifs : c'est une hypothèse — Scénario (estimation) —, la CVMA
+# ne publiant pas la Table 1 par province.
+#
+# Tout est matriciel : D (juridictions × mesures) = parts[:, None] * direct[None, :] et T = D * m[None, :].
+# Un choc (variation en % de l'activité directe) est un tableau diffusable vers (..., juridictions, mesures) :
+# plusieurs jeux de chocs, pour toutes les juridictions et toutes les mesures, s'évaluent en une seule passe.
+
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from linkinvet.data import CVMA_SNAPSHOT_PERIOD, VETS_COLUMN, dataset_version, derived, fact, get_df_ca
+
+# Clé -> (indicateur direct de la table de faits, multiplicateur du registre, libellé)
+MEASURES = {
+    "output": ("output_direct_mcad", "can_output_multiplier", "Production (M$ CAD)"),
+    "gdp": ("gdp_direct_mcad", "can_gdp_multiplier", "PIB (M$ CAD)"),
+    "employment": ("employment_direct_fte", "can_employment_multiplier", "Emplois (ETP)"),
+}
+GDP_INDEX = list(MEASURES).index("gdp")
+
+
+@dataclass(frozen=True)
+class ImpactBase:
+    juris: tuple[str, ...]
+    # Parts de répartition (vétérinaires actifs), une par juridiction ; somme = 1
+    shares: np.ndarray
+    # Impacts directs répartis : (juridictions, mesures)
+    direct: np.ndarray
+    # Multiplicateurs nationaux : (mesures,)
+    multipliers: np.ndarray
+    # Recettes fiscales totales par M$ de PIB total (appliqué au PIB total de chaque juridiction)
+    tax_per_gdp: float
+
+
+@lru_cache(maxsize=4)
+def _base(version: str) -> ImpactBase:
+    df_ca = get_df_ca()
+    vets = df_ca[VETS_COLUMN].to_numpy(dtype=float)
+    shares = vets / vets.sum()
+    national = np.array([fact(direct, "CA", CVMA_SNAPSHOT_PERIOD) for direct, _, _ in MEASURES.values()], dtype=float)
+    multipliers = np.array([derived(multiplier) for _, multiplier, _ in MEASURES.values()], dtype=float)
+    direct = shares[:, None] * national[None, :]
+    for array in (shares, direct, multipliers):
+        array.flags.writeable = False
+    return ImpactBase(
+        juris=tuple(df_ca["Juridiction"]),
+        shares=shares,
+        direct=direct,
+        multipliers=multipliers,
+        tax_per_gdp=float(derived("can_tax_per_gdp")),
+    )
+
+
+def base() -> ImpactBase:
+    """Répartition de référence (sans choc) — partagée, lecture seule."""
+    return _base(dataset_version())
+
+
+def evaluate(shocks=0.0) -> dict[str, np.ndarray]:
+    """Impacts pour des chocs en % de l'activité directe, diffusables vers (..., juridictions, mesures).
+
+    Renvoie direct / total / indirect_induced (..., juridictions, mesures) et taxes (..., juridictions).
+    """
+    b = base()
+    direct = b.direct * (1 + np.asarray(shocks, dtype=float) / 100)
+    total = direct * b.multipliers
+    return {
+        "direct": direct,
+        "total": total,
+        "indirect_induced": total - direct,
+        "taxes": total[..., GDP_INDEX] * b.tax_per_gdp,
+    }
+
+
+def shock_matrix(juris: list[str], pct: float, measures=tuple(MEASURES)) -> np.ndarray:
+    """Choc de pct % sur les juridictions et mesures choisies, 0 ailleurs : (juridictions, mesures)."""
+    b = base()
+    rows = np.isin(np.array(b.juris), juris)
+    cols = np.isin(np.array(list(MEASURES)), list(measures))
+    return np.where(rows[:, None] & cols[None, :], float(pct), 0.0)
+
+
+@lru_cache(maxsize=4)
+def _impact_table(version: str) -> pd.DataFrame:
+    b = base()
+    res = evaluate()
+    n_juris, n_measures = res["total"].shape
+    return pd.DataFrame({
+        "Juridiction": np.repeat(b.juris, n_measures),
+        "Mesure": np.tile([label for _, _, label in MEASURES.values()], n_juris),
+        "Direct (estim.)": res["direct"].ravel(),
+        "Multiplicateur (dérivé)": np.tile(b.multipliers, n_juris),
+        "Indirect + induit (estim.)": res["indirect_induced"].ravel(),
+        "Total (estim.)": res["total"].ravel(),
+    })
+
+
+def impact_table() -> pd.DataFrame:
+    """Table longue juridictions × mesures de la répartition de référence — partagée, lecture seule."""
+    return _impact_table(dataset_version())
@@ -0,0 +1,55 @@
+# Rapport de temps d'import (démarrage à froid) — s'appuie sur `python -X importtime` dans un processus neuf.
+#
+#   python -m linkinvet.importreport                       # modules importés par dashboard.py
+#   python -m linkinvet.importreport --top 30 plotly.express
+#
+# Les temps "cumulés" incluent les sous-imports ; "propre" est le temps du module seul.
+
+import argparse
+import subprocess
+import sys
+
+# Modules chargés par dashboard.py (le script lui-même ne peut pas être importé hors de Streamlit).
+DEFAULT_MODULES = ("streamlit", "linkinvet.data", "linkinvet.scenario", "linkinvet.figures", "plotly.express")
+
+
+def import_times(modules) -> list[tuple[str, int, int]]:
+    """(module, temps propre µs, temps cumulé µs) pour chaque import du processus neuf."""
+    code = "; ".join(f"import {m}" for m in modules)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(prog="python -m linkinvet.importreport")
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES)
+    parser.add_argument("--top", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    rows = import_times(args.modules)
+    # Modules de premier niveau demandés : leur temps cumulé est le coût réel de l'import.
+    print("Coût par module demandé (cumulé, à froid) :")
+    for name in args.modules:
+        cumulative = next((c for n, _, c in rows if n == name), None)
+        print(f"  {name:<30} {cumulative / 1000 if cumulative is not None else float('nan'):>9.1f} ms")
+    print(f"Total : {sum(s for _, s, _ in rows) / 1000:.1f} ms ({len(rows)} modules)")
+
+    print(f"\n{args.top} modules les plus coûteux (temps propre) :")
+    for name, self_us, cumulative_us in sorted(rows, key=lambda r: r[1], reverse=True)[:args.top]:
+        print(f"  {name:<50} propre {self_us / 1000:>8.1f} ms   cumulé {cumulative_us / 1000:>8.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
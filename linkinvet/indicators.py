@@ -0,0 +1,191 @@
+# Indicateurs dérivés — registre déclaratif, évalué comme un graphe de dépendances.
+#
+# Chaque indicateur déclare ses entrées (indicateurs officiels fournis par linkinvet.data, ou autres
+# indicateurs dérivés) et sa formule :
+#
+#   @REGISTRY.derived("can_ratio", "can_vets_active", "can_facilities", label="Ratio ...")
+#   def _(vets, facs):
+#       return vets / facs
+#
+# L'évaluateur conserve les valeurs de l'évaluation précédente : quand les données changent (nouvelle
+# version), seuls les nœuds dont une entrée a effectivement changé sont recalculés. Les valeurs sont
+# des scalaires ou des tableaux NumPy (une valeur par juridiction), en lecture seule.
+
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class Indicator:
+    name: str
+    inputs: tuple[str, ...]
+    formula: Callable
+    # Libellé affiché (nom de colonne dans les tableaux de linkinvet.data)
+    label: str
+
+
+class Registry:
+    """Indicateurs dérivés déclarés ; les entrées inconnues du registre sont des sources (officielles)."""
+
+    def __init__(self):
+        self._nodes: dict[str, Indicator] = {}
+        self._order: list[Indicator] | None = None
+
+    def derived(self, name: str, *inputs: str, label: str | None = None):
+        def register(formula):
+            if name in self._nodes:
+                raise ValueError(f"indicateur déjà déclaré : {name}")
+            self._nodes[name] = Indicator(name, tuple(inputs), formula, label or name)
+            self._order = None
+            return formula
+        return register
+
+    def __getitem__(self, name: str) -> Indicator:
+        return self._nodes[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._nodes
+
+    def order(self) -> list[Indicator]:
+        """Ordre topologique (entrées avant les nœuds qui les utilisent) ; refuse les cycles."""
+        if self._order is None:
+            order, state = [], {}
+
+            def visit(name: str, path: tuple):
+                if state.get(name) == "fait":
+                    return
+                if state.get(name) == "en cours":
+                    raise ValueError("cycle dans les indicateurs dérivés : " + " -> ".join(path + (name,)))
+                state[name] = "en cours"
+                node = self._nodes[name]
+                for dep in node.inputs:
+                    if dep in self._nodes:
+                        visit(dep, path + (name,))
+                state[name] = "fait"
+                order.append(node)
+
+            for name in self._nodes:
+                visit(name, ())
+            self._order = order
+        return self._order
+
+    def sources(self) -> set[str]:
+        """Entrées attendues de l'extérieur (indicateurs officiels)."""
+        return {dep for node in self._nodes.values() for dep in node.inputs if dep not in self._nodes}
+
+
+def _frozen(value):
+    if np.ndim(value) == 0:
+        return float(value)
+    array = np.array(value, dtype=float)
+    array.flags.writeable = False
+    return array
+
+
+def _same(a, b) -> bool:
+    return np.shape(a) == np.shape(b) and bool(np.array_equal(a, b, equal_nan=True))
+
+
+class Evaluator:
+    """Évaluation incrémentale d'un registre : un nœud n'est recalculé que si une de ses entrées a changé."""
+
+    def __init__(self, registry: Registry):
+        self.registry = registry
+        self._lock = threading.Lock()
+        self._values: dict[str, object] = {}
+        # Estampille de la dernière modification de chaque valeur (source ou nœud)
+        self._stamps: dict[str, int] = {}
+        # Nœud -> estampilles de ses entrées lors de son dernier calcul
+        self._seen: dict[str, tuple] = {}
+        self._clock = 0
+        self.last_recomputed: list[str] = []
+
+    def _set(self, name: str, value) -> None:
+        if name in self._values and _same(self._values[name], value):
+            return
+        self._clock += 1
+        self._values[name] = value
+        self._stamps[name] = self._clock
+
+    def evaluate(self, sources: dict) -> dict:
+        """Valeurs de tous les indicateurs dérivés pour ces sources (nom -> valeur)."""
+        missing = self.registry.sources() - set(sources)
+        if missing:
+            raise ValueError(f"source(s) manquante(s) : {', '.join(sorted(missing))}")
+        with self._lock:
+            for name, value in sources.items():
+                self._set(name, _frozen(value))
+            recomputed = []
+            for node in self.registry.order():
+                stamps = tuple(self._stamps[dep] for dep in node.inputs)
+                if self._seen.get(node.name) == stamps:
+                    continue
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    value = node.formula(*(self._values[dep] for dep in node.inputs))
+                self._set(node.name, _frozen(value))
+                self._seen[node.name] = stamps
+                recomputed.append(node.name)
+            self.last_recomputed = recomputed
+            return {node.name: self._values[node.name] for node in self.registry.order()}
+
+
+# -----------------------------
+# Registre des indicateurs dérivés du tableau de bord
+# -----------------------------
+# Sources (linkinvet.data) : can_* (Canada, scalaires), prov_* (une valeur par ligne de df_ca),
+# qc_* (OMVQ). Un nouvel indicateur = une fonction décorée ici.
+REGISTRY = Registry()
+
+
+@REGISTRY.derived("can_ratio", "can_vets_active", "can_facilities", label="Ratio (vétos / établissement) — indicateur dérivé")
+def _(vets, facs):
+    return vets / facs
+
+
+@REGISTRY.derived("can_tax_total", "can_tax_federal", "can_tax_provincial", "can_tax_municipal", label="Recettes fiscales totales (M$ CAD)")
+def _(federal, provincial, municipal):
+    return federal + provincial + municipal
+
+
+# Multiplicateurs économiques (CVMA, Table 1) : impact total (direct + indirect + induit) / impact direct
+@REGISTRY.derived("can_output_multiplier", "can_output_total", "can_output_direct", label="Multiplicateur — production")
+def _(total, direct):
+    return total / direct
+
+
+@REGISTRY.derived("can_gdp_multiplier", "can_gdp_total", "can_gdp_direct", label="Multiplicateur — PIB")
+def _(total, direct):
+    return total / direct
+
+
+@REGISTRY.derived("can_employment_multiplier", "can_employment_total", "can_employment_direct", label="Multiplicateur — emplois")
+def _(total, direct):
+    return total / direct
+
+
+@REGISTRY.derived("can_tax_per_gdp", "can_tax_total", "can_gdp_total", label="Recettes fiscales / PIB total")
+def _(tax_total, gdp_total):
+    return tax_total / gdp_total
+
+
+@REGISTRY.derived("prov_ratio", "prov_vets_active", "prov_facilities", label="Ratio (vétos / établissement) — indicateur dérivé")
+def _(vets, facs):
+    return vets / facs
+
+
+@REGISTRY.derived("prov_vets_per_10k", "prov_vets_active", "prov_population", label="Vétérinaires / 10 000 hab. — indicateur dérivé")
+def _(vets, population):
+    return vets / population * 10_000
+
+
+@REGISTRY.derived("prov_facilities_per_100k", "prov_facilities", "prov_population", label="Établissements / 100 000 hab. — indicateur dérivé")
+def _(facs, population):
+    return facs / population * 100_000
+
+
+@REGISTRY.derived("qc_practice_share", "qc_practice_counts", "qc_members_total", label="Part (%)")
+def _(counts, members_total):
+    return np.round(counts / members_total * 100, 1)
@@ -0,0 +1,227 @@
+# Générateur de charge local : N sessions websocket concurrentes contre un serveur Streamlit (dashboard.py).
+#
+#   streamlit run dashboard.py --server.headless true &
+#   python -m linkinvet.loadtest --sessions 50 --ramp 10 --server-pid $!
+#
+# Chaque session joue un script d'interactions réaliste (changement de vue, juridiction, glissement du
+# curseur solo_share) avec un temps de réflexion aléatoire, en parlant le protocole du navigateur
+# (BackMsg / ForwardMsg sur /_stcore/stream). Les widgets situés dans un st.fragment déclenchent un
+# rerun de fragment, comme dans le navigateur.
+#
+# Rapport : débit (reruns/s), latence p50/p95/p99 par type d'interaction, octets reçus par rerun,
+# mémoire résidente du serveur (si --server-pid) ramenée au nombre de sessions.
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+from tornado.httpclient import HTTPRequest
+from tornado.websocket import websocket_connect
+
+# (clé du widget, valeur) — les clés sont celles passées à st.radio / st.selectbox / st.slider dans dashboard.py
+DEFAULT_SCRIPT = [
+    ["view", "Scénarios (estimation)"],
+    ["widget_juris", "Ontario (ON)"],
+    ["widget_solo_share", 25], ["widget_solo_share", 30], ["widget_solo_share", 35], ["widget_solo_share", 40],
+    ["widget_juris", "Québec (QC)"],
+    ["widget_solo_share", 20],
+    ["view", "Québec (OMVQ)"],
+    ["view", "Canada (CVMA)"],
+]
+WIDGET_TYPES = ("radio", "selectbox", "slider")
+
+
+class Session:
+    """Une session navigateur simulée."""
+
+    def __init__(self, url: str):
+        self.url = url
+        self.ws = None
+        self.page_script_hash = ""
+        self.widgets = {}  # clé utilisateur -> (type, proto de l'élément, fragment_id)
+        self.states = {}   # id de widget -> WidgetState envoyé au serveur
+
+    async def connect(self) -> None:
+        request = HTTPRequest(self.url, headers={"Sec-WebSocket-Protocol": "streamlit"})
+        self.ws = await websocket_connect(request, max_message_size=256 * 1024 * 1024)
+
+    def close(self) -> None:
+        if self.ws is not None:
+            self.ws.close()
+
+    def _track(self, delta) -> None:
+        element = delta.new_element
+        kind = element.WhichOneof("type")
+        if kind not in WIDGET_TYPES:
+            return
+        proto = getattr(element, kind)
+        # Identifiant Streamlit d'un widget avec clé : "$$ID-<hash>-<clé>"
+        key = proto.id.rsplit("-", 1)[-1]
+        self.widgets[key] = (kind, proto, delta.fragment_id)
+
+    def set_widget(self, key: str, value) -> str:
+        """Met à jour l'état d'un widget ; renvoie le fragment à réexécuter ("" = script complet)."""
+        kind, proto, fragment_id = self.widgets[key]
+        state = WidgetState(id=proto.id)
+        if kind == "slider":
+            state.double_array_value.data.append(float(value))
+        else:
+            state.int_value = list(proto.options).index(value)
+        self.states[proto.id] = state
+        return fragment_id
+
+    async def rerun(self, fragment_id: str = "") -> tuple[float, int]:
+        """Envoie un rerun et attend la fin du script ; renvoie (latence en s, octets reçus)."""
+        msg = BackMsg()
+        msg.rerun_script.page_script_hash = self.page_script_hash
+        msg.rerun_script.widget_states.widgets.extend(self.states.values())
+        if fragment_id:
+            msg.rerun_script.fragment_id = fragment_id
+
+        start = time.perf_counter()
+        await self.ws.write_message(msg.SerializeToString(), binary=True)
+        received = 0
+        while True:
+            raw = await self.ws.read_message()
+            if raw is None:
+                raise ConnectionError("connexion fermée par le serveur")
+            received += len(raw)
+            fwd = ForwardMsg()
+            fwd.ParseFromString(raw)
+            kind = fwd.WhichOneof("type")
+            if kind == "new_session":
+                self.page_script_hash = fwd.new_session.page_script_hash
+            elif kind == "delta" and fwd.delta.WhichOneof("type") == "new_element":
+                self._track(fwd.delta)
+            elif kind == "script_finished" and fwd.script_finished != ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                return time.perf_counter() - start, received
+
+
+async def run_user(url: str, script: list, iterations: int, think_s: float, delay_s: float, samples: list, errors: list) -> None:
+    await asyncio.sleep(delay_s)
+    session = Session(url)
+    try:
+        await session.connect()
+        latency, size = await session.rerun()
+        samples.append(("initial_load", latency, size))
+        for _ in range(iterations):
+            for key, value in script:
+                await asyncio.sleep(random.expovariate(1 / think_s) if think_s > 0 else 0)
+                if key not in session.widgets:
+                    errors.append(f"widget introuvable : {key}")
+                    continue
+                latency, size = await session.rerun(session.set_widget(key, value))
+                samples.append((key, latency, size))
+    except Exception as exc:  # une session en échec ne doit pas interrompre les autres
+        errors.append(f"{type(exc).__name__}: {exc}")
+    finally:
+        session.close()
+
+
+def rss_kib(pid: int) -> int | None:
+    try:
+        with open(f"/proc/{pid}/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        return None
+    return None
+
+
+async def sample_memory(pid: int, peak: list, stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        value = rss_kib(pid)
+        if value is not None:
+            peak[0] = max(peak[0], value)
+        await asyncio.sleep(0.25)
+
+
+def report(samples: list, errors: list, elapsed_s: float, n_sessions: int, rss_before: int | None, rss_peak: int | None) -> dict:
+    result = {
+        "sessions": n_sessions,
+        "reruns": len(samples),
+        "errors": len(errors),
+        "elapsed_s": round(elapsed_s, 2),
+        "throughput_rps": round(len(samples) / elapsed_s, 2) if elapsed_s else 0.0,
+        "interactions": {},
+    }
+    for kind in sorted({s[0] for s in samples}):
+        latencies = np.array([s[1] for s in samples if s[0] == kind]) * 1000
+        sizes = np.array([s[2] for s in samples if s[0] == kind])
+        result["interactions"][kind] = {
+            "n": int(latencies.size),
+            "p50_ms": round(float(np.percentile(latencies, 50)), 1),
+            "p95_ms": round(float(np.percentile(latencies, 95)), 1),
+            "p99_ms": round(float(np.percentile(latencies, 99)), 1),
+            "bytes_p50": int(np.percentile(sizes, 50)),
+        }
+    if rss_before is not None and rss_peak:
+        result["server_rss_before_mib"] = round(rss_before / 1024, 1)
+        result["server_rss_peak_mib"] = round(rss_peak / 1024, 1)
+        result["server_mib_per_session"] = round((rss_peak - rss_before) / 1024 / n_sessions, 2)
+    return result
+
+
+async def run(args) -> dict:
+    script = json.loads(args.script.read_text(encoding="utf-8")) if args.script else DEFAULT_SCRIPT
+    url = args.url.rstrip("/") + "/_stcore/stream"
+    samples, errors = [], []
+
+    rss_before = rss_kib(args.server_pid) if args.server_pid else None
+    peak, stop = [rss_before or 0], asyncio.Event()
+    sampler = asyncio.create_task(sample_memory(args.server_pid, peak, stop)) if args.server_pid else None
+
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        run_user(url, script, args.iterations, args.think, args.ramp * i / args.sessions, samples, errors)
+        for i in range(args.sessions)
+    ))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    if sampler:
+        await sampler
+
+    for line in sorted(set(errors))[:10]:
+        print(f"erreur : {line}", file=sys.stderr)
+    return report(samples, errors, elapsed, args.sessions, rss_before, peak[0] if args.server_pid else None)
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(prog="python -m linkinvet.loadtest")
+    parser.add_argument("--url", default="ws://localhost:8501", help="adresse du serveur Streamlit")
+    parser.add_argument("--sessions", type=int, default=10, help="sessions concurrentes")
+    parser.add_argument("--ramp", type=float, default=5.0, help="durée de montée en charge (s)")
+    parser.add_argument("--iterations", type=int, default=3, help="répétitions du script par session")
+    parser.add_argument("--think", type=float, default=0.5, help="temps de réflexion moyen entre interactions (s)")
+    parser.add_argument("--script", type=Path, help="script JSON [[clé, valeur], ...] (défaut : DEFAULT_SCRIPT)")
+    parser.add_argument("--server-pid", type=int, help="PID du serveur, pour la mémoire résidente (/proc)")
+    parser.add_argument("--json", action="store_true", help="sortie JSON brute")
+    args = parser.parse_args(argv)
+
+    result = asyncio.run(run(args))
+    if args.json:
+        print(json.dumps(result, indent=2, ensure_ascii=False))
+        return 1 if result["errors"] else 0
+
+    print(f"{result['sessions']} sessions, {result['reruns']} reruns en {result['elapsed_s']} s "
+          f"-> {result['throughput_rps']} reruns/s, {result['errors']} erreur(s)")
+    print(f"{'interaction':<16}{'n':>7}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'octets p50':>13}")
+    for kind, row in result["interactions"].items():
+        print(f"{kind:<16}{row['n']:>7}{row['p50_ms']:>10}{row['p95_ms']:>10}{row['p99_ms']:>10}{row['bytes_p50']:>13,}")
+    if "server_mib_per_session" in result:
+        print(f"mémoire serveur : {result['server_rss_before_mib']} -> {result['server_rss_peak_mib']} Mio "
+              f"(~{result['server_mib_per_session']} Mio / session)")
+    return 1 if result["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
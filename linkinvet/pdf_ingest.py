@@ -0,0 +1,316 @@
+# Ingestion hors ligne des rapports PDF CVMA / OMVQ (copies locales) vers la table de faits.
+#
+#   python -m linkinvet.pdf_ingest cvma rapports/cvma_final-report-en.pdf --period 2023-24
+#   python -m linkinvet.pdf_ingest omvq rapports/omvq-portrait-2024.pdf --period 2024-09-26 --ingest
+#
+# 1. Extraction texte + tableaux page par page (pdfplumber, requirements-tools.txt), répartie sur un pool
+#    de processus. Le résultat est mis en cache par empreinte SHA-256 du PDF : une relance sur un PDF
+#    inchangé ne relit pas le document.
+# 2. Reconnaissance des tableaux (CVMA : Table 1, Figures 1–2 ; OMVQ : pratique principale, régions).
+#    Ces règles sont heuristiques : le CSV produit dans data/staging/ doit être relu avant --ingest.
+
+import argparse
+import csv
+import json
+import os
+import re
+import sys
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from linkinvet import dataset
+
+# À incrémenter si le format des pages extraites change (invalide le cache).
+EXTRACTION_VERSION = 1
+CACHE_DIR = Path(os.environ.get("LINKINVET_CACHE_DIR", Path(__file__).resolve().parent.parent / ".cache")) / "pdf"
+STAGING_DIR = dataset.DATA_DIR / "staging"
+
+SOURCES = {
+    "cvma": "CVMA — Economic Impact 2024 Update",
+    "omvq": "OMVQ — Portrait démographique 2024",
+}
+
+# Ventilations régionales OMVQ (linkinvet.data.QC_REGION_BREAKDOWNS) -> mot-clé (normalisé) des pages concernées
+REGION_BREAKDOWN_KEYWORDS = {
+    "companion_by_region": "compagnie",
+    "large_animals_by_region": "grands animaux",
+    "equine_by_region": "equin",
+}
+
+PROVINCE_CODES = ("ON", "QC", "AB", "BC", "SK", "NS", "MB", "NB", "PE", "NL", "YK", "NT")
+
+# Nombre au format anglais (1,234.5) ou français (1 234,5 — espace insécable ou fine). Une espace simple
+# n'est pas un séparateur de milliers : elle sépare les étiquettes voisines ("5386 3212" = deux nombres).
+_NUM = r"\d{1,3}(?:[,\u00a0\u2009\u202f]\d{3})+(?:[.,]\d+)?|\d+(?:[.,]\d+)?"
+NUM_RE = re.compile(_NUM)
+N_EQUALS_RE = re.compile(r"n\s*=\s*(" + _NUM + ")")
+PERIOD_LABEL_RE = re.compile(r"\b(?:19|20)\d{2}\s*[-–/]\s*\d{2,4}\b")
+
+
+def parse_number(text: str) -> float:
+    text = re.sub(r"\s", "", text)
+    if "," in text and "." not in text and re.search(r",\d{1,2}$", text):
+        text = text.replace(",", ".")  # décimale française
+    return float(text.replace(",", ""))
+
+
+def normalize(text: str) -> str:
+    """Minuscules, sans accents, tirets et espaces unifiés — pour comparer des libellés."""
+    text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
+    return re.sub(r"\s+", " ", re.sub(r"[-–—]", "-", text)).strip().lower()
+
+
+# -----------------------------
+# Extraction (pool de processus + cache par empreinte)
+# -----------------------------
+def _import_pdfplumber():
+    try:
+        import pdfplumber
+    except ImportError as exc:
+        raise SystemExit("pdfplumber est requis : pip install -r requirements-tools.txt") from exc
+    return pdfplumber
+
+
+def _extract_pages(path: str, page_numbers: list[int]) -> list[dict]:
+    pdfplumber = _import_pdfplumber()
+    pages = []
+    with pdfplumber.open(path) as pdf:
+        for i in page_numbers:
+            page = pdf.pages[i]
+            pages.append({
+                "page": i + 1,
+                "text": page.extract_text() or "",
+                "tables": page.extract_tables() or [],
+            })
+    return pages
+
+
+def extract_pdf(path: Path, workers: int | None = None) -> list[dict]:
+    """Pages extraites (texte + tableaux), depuis le cache si le PDF n'a pas changé."""
+    cache_path = CACHE_DIR / f"{dataset.file_sha256(path)}.v{EXTRACTION_VERSION}.json"
+    if cache_path.exists():
+        return json.loads(cache_path.read_text(encoding="utf-8"))
+
+    pdfplumber = _import_pdfplumber()
+    with pdfplumber.open(path) as pdf:
+        n_pages = len(pdf.pages)
+    workers = max(1, min(workers or os.cpu_count() or 1, n_pages))
+    chunks = [list(range(start, n_pages, workers)) for start in range(workers)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(_extract_pages, [str(path)] * len(chunks), chunks)
+    pages = sorted((page for chunk in results for page in chunk), key=lambda p: p["page"])
+
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(pages, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp, cache_path)
+    return pages
+
+
+# -----------------------------
+# Reconnaissance — CVMA
+# -----------------------------
+# Ligne de la Table 1 -> (indicateur "direct" = premier nombre, indicateur "total" = dernier nombre)
+CVMA_TABLE1_ROWS = {
+    "output": ("output_direct_mcad", "output_total_mcad"),
+    "gdp": ("gdp_direct_mcad", "gdp_total_mcad"),
+    "employment": ("employment_direct_fte", "employment_total_fte"),
+    "federal": (None, "tax_federal_mcad"),
+    "provincial": (None, "tax_provincial_mcad"),
+    "municipal": (None, "tax_municipal_mcad"),
+}
+
+
+def _segment_after(text: str, caption: re.Pattern) -> str | None:
+    m = caption.search(text)
+    if not m:
+        return None
+    segment = text[m.end():]
+    nxt = re.search(r"\b(?:Table|Figure)\s+\d", segment)
+    return segment[:nxt.start()] if nxt else segment
+
+
+def parse_cvma_table1(pages: list[dict]) -> dict:
+    found = {}
+    for page in pages:
+        segment = _segment_after(page["text"], re.compile(r"\bTable\s+1\b"))
+        if segment is None:
+            continue
+        for line in segment.splitlines():
+            key = normalize(line).split(" ", 1)[0]
+            if key not in CVMA_TABLE1_ROWS or CVMA_TABLE1_ROWS[key][1] in found:
+                continue
+            numbers = [parse_number(n) for n in NUM_RE.findall(PERIOD_LABEL_RE.sub(" ", line))]
+            if not numbers:
+                continue
+            direct, total = CVMA_TABLE1_ROWS[key]
+            found[total] = numbers[-1]
+            if direct and len(numbers) > 1:
+                found[direct] = numbers[0]
+        if found:
+            break
+    return found
+
+
+def _province_values_from_tables(tables: list) -> dict | None:
+    for table in tables:
+        for i, row in enumerate(table[:-1]):
+            cells = [(c or "").strip() for c in row]
+            if sum(c in PROVINCE_CODES for c in cells) < len(PROVINCE_CODES):
+                continue
+            # Dernière ligne numérique sous l'en-tête = période la plus récente de la figure
+            for values in reversed(table[i + 1:]):
+                pairs = {
+                    code: parse_number(v) for code, v in zip(cells, values)
+                    if code in PROVINCE_CODES and v and NUM_RE.fullmatch(v.strip())
+                }
+                if len(pairs) == len(PROVINCE_CODES):
+                    return pairs
+    return None
+
+
+def parse_cvma_province_figure(pages: list[dict], figure_no: int) -> dict:
+    """Valeurs par province d'une figure CVMA ; {} si la figure n'est pas reconnue sans ambiguïté."""
+    caption = re.compile(rf"\bFigure\s+{figure_no}\b")
+    for page in pages:
+        segment = _segment_after(page["text"], caption)
+        if segment is None:
+            continue
+        from_tables = _province_values_from_tables(page["tables"])
+        if from_tables:
+            return from_tables
+        segment = PERIOD_LABEL_RE.sub(" ", segment)
+        codes = list(dict.fromkeys(re.findall(r"\b(" + "|".join(PROVINCE_CODES) + r")\b", segment)))
+        # Étiquettes de barres : une ligne de 12 valeurs par période, la dernière période en dernier.
+        rows = [numbers for numbers in (NUM_RE.findall(line) for line in segment.splitlines()) if len(numbers) == len(codes)]
+        if len(codes) == len(PROVINCE_CODES) and rows:
+            return dict(zip(codes, (parse_number(n) for n in rows[-1])))
+    return {}
+
+
+def parse_cvma(pages: list[dict]) -> list[tuple]:
+    rows = [(indicator, "CA", value) for indicator, value in parse_cvma_table1(pages).items()]
+    for figure_no, indicator in ((1, "vets_active"), (2, "facilities_accredited")):
+        rows += [(indicator, code, value) for code, value in parse_cvma_province_figure(pages, figure_no).items()]
+    return rows
+
+
+# -----------------------------
+# Reconnaissance — OMVQ
+# -----------------------------
+def _line_value(line: str) -> float | None:
+    m = N_EQUALS_RE.search(line)
+    if m:
+        return parse_number(m.group(1))
+    numbers = NUM_RE.findall(line.split("%")[-1])
+    return parse_number(numbers[-1]) if numbers else None
+
+
+def _labelled_values(pages: list[dict], labels: list[str]) -> dict:
+    """Première ligne commençant par chaque libellé -> valeur "n=" (à défaut, dernier nombre après le %)."""
+    wanted = {normalize(label): label for label in labels}
+    found = {}
+    for page in pages:
+        for line in page["text"].splitlines():
+            norm = normalize(line)
+            for key, label in wanted.items():
+                if label not in found and norm.startswith(key):
+                    value = _line_value(line)
+                    if value is not None:
+                        found[label] = value
+    return found
+
+
+def parse_omvq(pages: list[dict]) -> list[tuple]:
+    practice_labels = [ind.split("/", 1)[1] for ind in _known_indicators("practice_main/")]
+    with open(dataset.DATA_DIR / "qc_regions.csv", encoding="utf-8") as f:
+        regions = [row["region"] for row in csv.DictReader(f)]
+
+    rows = [(f"practice_main/{label}", "QC", v) for label, v in _labelled_values(pages, practice_labels).items()]
+    # Répartitions régionales par type de pratique (pages mentionnant la pratique et les régions)
+    for prefix, keyword in REGION_BREAKDOWN_KEYWORDS.items():
+        region_pages = [p for p in pages if keyword in normalize(p["text"]) and "region" in normalize(p["text"])]
+        rows += [(f"{prefix}/{label}", "QC", v) for label, v in _labelled_values(region_pages, regions).items()]
+    return rows
+
+
+def _known_indicators(prefix: str) -> list[str]:
+    facts = dataset.load_facts(["indicator"]).column("indicator").to_pylist()
+    return list(dict.fromkeys(ind for ind in facts if ind.startswith(prefix)))
+
+
+PARSERS = {"cvma": parse_cvma, "omvq": parse_omvq}
+
+
+# -----------------------------
+# Commande
+# -----------------------------
+def kept_rows(rows: list[tuple], name: str) -> list[dict]:
+    """Lignes de la partition existante <name> que l'extraction n'a pas reconnues (conservées telles quelles).
+
+    Les règles ne couvrent pas tout le document (ex. effectifs de membres OMVQ) : un remplacement ne doit
+    pas retirer ces valeurs de la table de faits.
+    """
+    existing = dataset.FACTS_DIR / f"{name}.csv"
+    if not existing.exists():
+        return []
+    extracted = {(indicator, jurisdiction) for indicator, jurisdiction, _ in rows}
+    with open(existing, encoding="utf-8") as f:
+        return [row for row in csv.DictReader(f) if (row["indicator"], row["jurisdiction"]) not in extracted]
+
+
+def write_staging(rows: list[tuple], source: str, period: str, name: str, kept: list[dict] = ()) -> Path:
+    STAGING_DIR.mkdir(parents=True, exist_ok=True)
+    path = STAGING_DIR / f"{name}.csv"
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(dataset.FACT_COLUMNS)
+        for indicator, jurisdiction, value in rows:
+            writer.writerow([indicator, jurisdiction, period, SOURCES[source], f"{value:g}", "Officiel"])
+        for row in kept:
+            writer.writerow([row[column] for column in dataset.FACT_COLUMNS])
+    return path
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(prog="python -m linkinvet.pdf_ingest")
+    parser.add_argument("source", choices=sorted(PARSERS))
+    parser.add_argument("pdf", type=Path)
+    parser.add_argument("--period", required=True, help="période des chiffres, ex. 2023-24 ou 2024-09-26")
+    parser.add_argument("--name", help="nom de partition (défaut : <source>-<période>)")
+    parser.add_argument("--workers", type=int, help="processus d'extraction (défaut : nombre de CPU)")
+    parser.add_argument("--ingest", action="store_true", help="ajouter la partition à data/facts/ après extraction")
+    parser.add_argument("--replace", action="store_true",
+                        help="remplacer une partition existante (les valeurs non reconnues y sont conservées)")
+    args = parser.parse_args(argv)
+
+    pages = extract_pdf(args.pdf, args.workers)
+    rows = PARSERS[args.source](pages)
+    if not rows:
+        print(f"erreur : aucun tableau reconnu dans {args.pdf} ({len(pages)} pages)", file=sys.stderr)
+        return 1
+
+    name = args.name or f"{args.source}-{args.period}"
+    kept = kept_rows(rows, name) if args.replace else []
+    staging = write_staging(rows, args.source, args.period, name, kept)
+    print(f"{len(rows)} valeurs extraites de {len(pages)} pages -> {staging}")
+    for indicator, jurisdiction, value in rows:
+        print(f"  {indicator:<50} {jurisdiction:<3} {value:g}")
+    if kept:
+        print(f"{len(kept)} valeur(s) non reconnue(s) conservée(s) de la partition {name} :")
+        for row in kept:
+            print(f"  {row['indicator']:<50} {row['jurisdiction']:<3} {row['value']}")
+
+    if args.ingest:
+        try:
+            target = dataset.ingest(staging, name, args.replace)
+        except (FileExistsError, ValueError) as exc:
+            print(f"erreur : {exc}", file=sys.stderr)
+            return 1
+        print(f"partition ajoutée : {target}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,83 @@
+# Instrumentation des reruns — temps par section nommée, agrégés pour tout le processus (toutes sessions).
+#
+#   perf.start_run()                        # début de script
+#   with perf.section("données CVMA"): ...  # section chronométrée
+#   perf.end_run()                          # fin de script : une ligne JSON par rerun si LINKINVET_PERF_LOG est défini
+#
+# Streamlit exécute chaque session dans son propre thread : le rerun en cours est suivi par thread.
+# Les reruns partiels (st.fragment) alimentent les agrégats sans ouvrir de rerun complet.
+
+import json
+import os
+import threading
+import time
+import uuid
+from collections import deque
+from contextlib import contextmanager
+
+# Nombre d'échantillons conservés par section (fenêtre glissante pour p50 / p95).
+WINDOW = 2048
+LOG_PATH = os.environ.get("LINKINVET_PERF_LOG")
+
+_lock = threading.Lock()
+_samples: dict[str, deque] = {}
+_local = threading.local()
+
+
+def record(name: str, ms: float) -> None:
+    with _lock:
+        _samples.setdefault(name, deque(maxlen=WINDOW)).append(ms)
+    run = getattr(_local, "run", None)
+    if run is not None:
+        run["sections"][name] = run["sections"].get(name, 0.0) + ms
+
+
+@contextmanager
+def section(name: str):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(name, (time.perf_counter() - start) * 1000)
+
+
+def start_run() -> None:
+    _local.run = {"run": uuid.uuid4().hex[:12], "start": time.time(), "t0": time.perf_counter(), "sections": {}}
+
+
+def end_run() -> None:
+    run = getattr(_local, "run", None)
+    _local.run = None
+    if run is None:
+        return
+    total_ms = (time.perf_counter() - run.pop("t0")) * 1000
+    record("rerun (total)", total_ms)
+    if LOG_PATH:
+        line = json.dumps({**run, "total_ms": round(total_ms, 3)}, ensure_ascii=False)
+        with _lock, open(LOG_PATH, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+
+def summary() -> list[dict]:
+    """p50 / p95 / max par section, du plus coûteux (p95) au moins coûteux."""
+    import numpy as np  # différé : perf est importé avant les modules lourds (voir dashboard.py)
+
+    with _lock:
+        snapshot = {name: np.fromiter(values, dtype=float) for name, values in _samples.items()}
+    rows = [
+        {
+            "section": name,
+            "n": len(values),
+            "p50_ms": round(float(np.percentile(values, 50)), 2),
+            "p95_ms": round(float(np.percentile(values, 95)), 2),
+            "max_ms": round(float(values.max()), 2),
+        }
+        for name, values in snapshot.items()
+        if len(values)
+    ]
+    return sorted(rows, key=lambda row: row["p95_ms"], reverse=True)
+
+
+def reset() -> None:
+    with _lock:
+        _samples.clear()
@@ -0,0 +1,250 @@
+# Moteur de scénario "solo" vs "multi-vétérinaires" — Scénario (estimation), pas un constat.
+#
+# Le modèle est évalué en opérations NumPy diffusées (broadcasting) : un point unique (juridiction,
+# part solo) et la grille complète juridictions × parts solo passent par le même calcul.
+
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from linkinvet.data import FACILITIES_COLUMN, VETS_COLUMN, dataset_version, get_df_ca
+
+# Grille par défaut du curseur "Part hypothétique d’établissements à vétérinaire unique (%)"
+SOLO_SHARE_GRID = tuple(range(0, 81, 5))
+
+# Hypothèse explicite : 1 vétérinaire actif par établissement "solo"
+DEFAULT_VETS_PER_SOLO = 1.0
+
+# Sélection par défaut de la vue Scénarios (partagée avec le préchauffage, linkinvet.warmup)
+DEFAULT_JURIS = "Québec (QC)"
+DEFAULT_SOLO_SHARE = 20
+
+
+def solve(vets, facs, solo_share, vets_per_solo=DEFAULT_VETS_PER_SOLO) -> dict:
+    """Évalue le modèle ; les arguments sont des scalaires ou des tableaux compatibles (broadcasting).
+
+    solo_share est exprimé en % des établissements accrédités.
+    """
+    vets = np.asarray(vets, dtype=float)
+    facs = np.asarray(facs, dtype=float)
+    solo_facilities = facs * (np.asarray(solo_share, dtype=float) / 100.0)
+    multi_facilities = facs - solo_facilities
+    solo_vets_est = solo_facilities * vets_per_solo
+    multi_vets_est = np.maximum(vets - solo_vets_est, 0)
+    multi_ratio_est = np.divide(
+        multi_vets_est,
+        multi_facilities,
+        out=np.full(np.broadcast(multi_vets_est, multi_facilities).shape, np.nan),
+        where=multi_facilities > 0,
+    )
+    return {
+        "solo_facilities": solo_facilities,
+        "multi_facilities": multi_facilities,
+        "solo_vets_est": solo_vets_est,
+        "multi_vets_est": multi_vets_est,
+        "multi_ratio_est": multi_ratio_est,
+    }
+
+
+@lru_cache(maxsize=1024)
+def _scenario_point(version: str, juris: str, solo_share: float, vets_per_solo: float) -> dict:
+    df_ca = get_df_ca()
+    row = df_ca[df_ca["Juridiction"] == juris].iloc[0]
+    vets = float(row[VETS_COLUMN])
+    facs = float(row[FACILITIES_COLUMN])
+    res = solve(vets, facs, solo_share, vets_per_solo)
+    return {
+        "vets": vets,
+        "facs": facs,
+        "ratio": float(row["Ratio (vétos / établissement) — indicateur dérivé"]),
+        **{name: float(value) for name, value in res.items()},
+    }
+
+
+def scenario_point(juris: str, solo_share: float, vets_per_solo: float = DEFAULT_VETS_PER_SOLO) -> dict:
+    """Résultat du modèle pour une juridiction (libellé) et une part solo, en scalaires.
+
+    Mémoïsé par (version des données, juridiction, part solo, vétos / solo) pour tout le processus :
+    un lien partagé (?juris=QC&solo_share=20) ou un scénario fréquent est relu sans recalcul.
+    Ne pas modifier le dict renvoyé (partagé entre sessions).
+    """
+    return _scenario_point(dataset_version(), juris, float(solo_share), float(vets_per_solo))
+
+
+@lru_cache(maxsize=8)
+def _scenario_grid(version: str, solo_shares: tuple, vets_per_solo: float) -> pd.DataFrame:
+    df_ca = get_df_ca()
+    shares = np.asarray(solo_shares, dtype=float)
+    # (juridictions, 1) × (1, parts solo) -> (juridictions, parts solo)
+    res = solve(
+        df_ca[VETS_COLUMN].to_numpy()[:, None],
+        df_ca[FACILITIES_COLUMN].to_numpy()[:, None],
+        shares[None, :],
+        vets_per_solo,
+    )
+    n_juris, n_shares = len(df_ca), len(shares)
+    return pd.DataFrame({
+        "Juridiction": np.repeat(df_ca["Juridiction"].to_numpy(), n_shares),
+        "Part solo (%)": np.tile(shares, n_juris),
+        "Établissements 'solo' (estim.)": res["solo_facilities"].ravel(),
+        "Établissements multi (estim.)": res["multi_facilities"].ravel(),
+        "Vétérinaires 'solo' (estim.)": res["solo_vets_est"].ravel(),
+        "Vétérinaires en structure multi (estim.)": res["multi_vets_est"].ravel(),
+        "Vétos / établissement multi (estim.)": res["multi_ratio_est"].ravel(),
+    })
+
+
+def scenario_grid(solo_shares=SOLO_SHARE_GRID, vets_per_solo=DEFAULT_VETS_PER_SOLO) -> pd.DataFrame:
+    """Table longue (tidy) : toutes les juridictions × toutes les parts solo, en une seule passe.
+
+    Mise en cache par version du jeu de données — partagée, lecture seule.
+    """
+    return _scenario_grid(dataset_version(), tuple(solo_shares), float(vets_per_solo))
+
+
+# -----------------------------
+# Sensibilité (diagrammes en tornade)
+# -----------------------------
+# Hypothèses perturbées une à une autour du point (part solo, vétos / solo) choisi : de ±pct % pour les
+# valeurs, de ±pct points de pourcentage pour la part solo (additif, borné à [0, 100] : une part de 0 %
+# reste perturbée).
+SENSITIVITY_INPUTS = {
+    "solo_share": "Part solo (± points de %)",
+    "vets_per_solo": "Vétérinaires par établissement solo",
+    "vets": "Vétérinaires actifs (officiel)",
+    "facs": "Établissements accrédités (officiel)",
+}
+SENSITIVITY_OUTPUTS = {
+    "multi_ratio_est": "Vétos / établissement multi (estim.)",
+    "multi_vets_est": "Vétérinaires en structure multi (estim.)",
+    "solo_vets_est": "Vétérinaires 'solo' (estim.)",
+}
+DEFAULT_SENSITIVITY_PCT = 20
+
+
+@lru_cache(maxsize=32)
+def _sensitivity(version: str, pct: float, solo_share: float, vets_per_solo: float) -> pd.DataFrame:
+    df_ca = get_df_ca()
+    n_inputs = len(SENSITIVITY_INPUTS)
+    # Sens de la perturbation (1 + 2 × hypothèses, hypothèses) : ligne 0 = base, puis -pct / +pct par hypothèse
+    signs = np.zeros((1 + 2 * n_inputs, n_inputs))
+    idx = np.arange(n_inputs)
+    signs[1 + 2 * idx, idx] = -1
+    signs[2 + 2 * idx, idx] = 1
+    factors = 1 + signs * pct / 100
+
+    # Toutes les perturbations × toutes les juridictions en un seul appel : (perturbations, juridictions)
+    res = solve(
+        df_ca[VETS_COLUMN].to_numpy()[None, :] * factors[:, [2]],
+        df_ca[FACILITIES_COLUMN].to_numpy()[None, :] * factors[:, [3]],
+        np.clip(solo_share + signs[:, [0]] * pct, 0, 100),
+        vets_per_solo * factors[:, [1]],
+    )
+
+    juris = df_ca["Juridiction"].to_numpy()
+    tables = []
+    for key, label in SENSITIVITY_OUTPUTS.items():
+        out = res[key]
+        low, high = out[1::2], out[2::2]  # (hypothèses, juridictions)
+        tables.append(pd.DataFrame({
+            "Indicateur": label,
+            "Juridiction": np.tile(juris, n_inputs),
+            "Hypothèse": np.repeat(list(SENSITIVITY_INPUTS.values()), len(juris)),
+            "Base": np.tile(out[0], n_inputs),
+            "Bas": low.ravel(),
+            "Haut": high.ravel(),
+            "Amplitude": np.abs(high - low).ravel(),
+        }))
+    return pd.concat(tables, ignore_index=True)
+
+
+def sensitivity(pct: float = DEFAULT_SENSITIVITY_PCT, solo_share: float = DEFAULT_SOLO_SHARE, vets_per_solo: float = DEFAULT_VETS_PER_SOLO) -> pd.DataFrame:
+    """Table longue indicateur × juridiction × hypothèse (valeurs à -pct / +pct), toutes juridictions.
+
+    Mise en cache par (version des données, pct, point de base) : changer de juridiction ne fait que filtrer.
+    """
+    return _sensitivity(dataset_version(), float(pct), float(solo_share), float(vets_per_solo))
+
+
+# -----------------------------
+# Mode incertitude (Monte Carlo)
+# -----------------------------
+# Distribution d'une hypothèse : kind = "triangulaire" (low, mode, high) ou "uniforme" (low, high).
+@dataclass(frozen=True)
+class Distribution:
+    kind: str
+    low: float
+    mode: float
+    high: float
+
+    def sample(self, rng: np.random.Generator, n: int) -> np.ndarray:
+        if self.high <= self.low:
+            return np.full(n, float(self.low))
+        if self.kind == "uniforme":
+            return rng.uniform(self.low, self.high, n)
+        if self.kind == "triangulaire":
+            return rng.triangular(self.low, min(max(self.mode, self.low), self.high), self.high, n)
+        raise ValueError(f"Distribution inconnue : {self.kind!r}")
+
+
+# Paramètres par défaut du mode incertitude (curseurs de la vue Scénarios)
+MC_DEFAULT_SOLO_SHARE = Distribution("triangulaire", 10, 20, 40)
+MC_DEFAULT_VETS_PER_SOLO = Distribution("triangulaire", 1.0, 1.0, 1.5)
+MC_DEFAULT_DRAWS = 100_000
+MC_DRAW_OPTIONS = (100_000, 250_000, 500_000)
+
+MC_OUTPUTS = {
+    "solo_facilities": "Établissements 'solo' (estim.)",
+    "solo_vets_est": "Vétérinaires 'solo' (estim.)",
+    "multi_vets_est": "Vétérinaires en structure multi (estim.)",
+}
+MC_PERCENTILES = (5, 25, 50, 75, 95)
+MC_HIST_BINS = 40
+
+
+@dataclass(frozen=True)
+class MonteCarloResult:
+    # Table longue : Juridiction × indicateur × P5..P95 (+ moyenne)
+    percentiles: pd.DataFrame
+    # (juridiction, clé d'indicateur) -> (bornes des classes, effectifs)
+    histograms: dict
+
+
+@lru_cache(maxsize=32)
+def _monte_carlo(version: str, solo_share: Distribution, vets_per_solo: Distribution, n_draws: int, seed: int) -> MonteCarloResult:
+    df_ca = get_df_ca()
+    rng = np.random.default_rng(seed)
+    # Tirages communs à toutes les juridictions : (n_draws, 1) × (1, juridictions)
+    share = solo_share.sample(rng, n_draws)[:, None]
+    vps = vets_per_solo.sample(rng, n_draws)[:, None]
+    res = solve(
+        df_ca[VETS_COLUMN].to_numpy()[None, :],
+        df_ca[FACILITIES_COLUMN].to_numpy()[None, :],
+        share,
+        vps,
+    )
+
+    rows = []
+    histograms = {}
+    juris = df_ca["Juridiction"].tolist()
+    for key, label in MC_OUTPUTS.items():
+        draws = res[key]
+        pct = np.percentile(draws, MC_PERCENTILES, axis=0)
+        mean = draws.mean(axis=0)
+        for j, name in enumerate(juris):
+            row = {"Juridiction": name, "Indicateur": label, "Moyenne": mean[j]}
+            row.update({f"P{p}": pct[i, j] for i, p in enumerate(MC_PERCENTILES)})
+            rows.append(row)
+            counts, edges = np.histogram(draws[:, j], bins=MC_HIST_BINS)
+            histograms[(name, key)] = (edges, counts)
+    return MonteCarloResult(percentiles=pd.DataFrame(rows), histograms=histograms)
+
+
+def monte_carlo(solo_share: Distribution, vets_per_solo: Distribution, n_draws: int = MC_DEFAULT_DRAWS, seed: int = 2024) -> MonteCarloResult:
+    """Tirages vectorisés des hypothèses pour toutes les juridictions (graine fixe : résultats reproductibles).
+
+    Seuls les percentiles et histogrammes sont conservés en cache, par jeu de paramètres.
+    """
+    return _monte_carlo(dataset_version(), solo_share, vets_per_solo, int(n_draws), int(seed))
@@ -0,0 +1,45 @@
+# Lanceur du serveur : préchauffe les caches du processus, puis démarre Streamlit dans ce même processus.
+#
+#   python -m linkinvet.serve [--api-port 8502] [options streamlit run...]
+#   python -m linkinvet.serve --server.port 8501 --server.headless true
+#
+# Le serveur n'écoute (et /_stcore/health ne répond) qu'une fois les données, figures et scénario par
+# défaut construits : le premier visiteur après un déploiement ne paie aucun rerun à froid.
+# Avec --api-port, l'API JSON (linkinvet.api) est servie dans le même processus et partage ces caches.
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from linkinvet import warmup
+
+APP_PATH = Path(__file__).resolve().parent.parent / "dashboard.py"
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(prog="python -m linkinvet.serve", add_help=False)
+    parser.add_argument("--api-port", type=int, help="servir aussi l'API JSON sur ce port")
+    parser.add_argument("--api-host", default="127.0.0.1")
+    args, streamlit_args = parser.parse_known_args(argv)
+
+    start = time.perf_counter()
+    warmup.prewarm_imports().join()
+    timings = warmup.warm_caches()
+    details = ", ".join(f"{name} {seconds * 1000:.0f} ms" for name, seconds in timings.items())
+    print(f"linkinvet : caches préchauffés en {time.perf_counter() - start:.2f} s ({details})", flush=True)
+
+    if args.api_port:
+        from linkinvet import api
+
+        api.start_in_thread(args.api_host, args.api_port)
+        print(f"linkinvet : API JSON sur http://{args.api_host}:{args.api_port}/v1/version", flush=True)
+
+    from streamlit.web import cli as stcli
+
+    sys.argv = ["streamlit", "run", str(APP_PATH), *streamlit_args]
+    return stcli.main()
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
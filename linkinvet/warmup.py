@@ -0,0 +1,71 @@
+# Préchauffage du processus — imports lourds chargés en tâche de fond, une seule fois par processus.
+#
+# prewarm_imports() est appelé en tête de dashboard.py : plotly se charge dans un thread pendant que le
+# script affiche l'en-tête et construit les tableaux. Ne pas importer de module lourd ici.
+
+import importlib
+import threading
+import time
+
+# Du plus lourd au plus léger (mesures : python -m linkinvet.importreport)
+HEAVY_MODULES = (
+    "plotly.express",
+    "plotly.graph_objects",
+    "plotly.io",
+    "pandas",
+    "pyarrow",
+    "numpy",
+)
+
+_lock = threading.Lock()
+_thread: threading.Thread | None = None
+# module -> durée d'import (s) dans le thread de préchauffage
+import_times: dict[str, float] = {}
+
+
+def _import_all(modules) -> None:
+    for name in modules:
+        start = time.perf_counter()
+        importlib.import_module(name)
+        import_times[name] = time.perf_counter() - start
+
+
+def prewarm_imports(modules=HEAVY_MODULES) -> threading.Thread:
+    """Lance (une seule fois) l'import des modules lourds dans un thread démon."""
+    global _thread
+    with _lock:
+        if _thread is None:
+            _thread = threading.Thread(target=_import_all, args=(tuple(modules),), name="linkinvet-prewarm", daemon=True)
+            _thread.start()
+        return _thread
+
+
+def warm_caches() -> dict[str, float]:
+    """Remplit les caches de données et de figures pour la vue par défaut ; renvoie les durées (s) par étape.
+
+    Les caches sont ceux du processus (linkinvet.data, linkinvet.figures, linkinvet.scenario, linkinvet.impact,
+    linkinvet.workforce) : à appeler dans le processus qui sert l'application, avant qu'il n'accepte des
+    connexions (linkinvet.serve). Le scénario par défaut couvre tout ce que construit la vue Scénarios,
+    ouverte directement par un lien partagé.
+    """
+    from linkinvet import data, figures, impact, scenario, workforce
+
+    steps = {
+        "données": lambda: (data.get_facts(), data.get_df_ca(), data.get_qc_practice_main(), data.get_cvma_timeseries()),
+        "scénario par défaut": lambda: (
+            scenario.scenario_point(scenario.DEFAULT_JURIS, scenario.DEFAULT_SOLO_SHARE),
+            scenario.scenario_grid(),
+            scenario.monte_carlo(scenario.MC_DEFAULT_SOLO_SHARE, scenario.MC_DEFAULT_VETS_PER_SOLO, scenario.MC_DEFAULT_DRAWS),
+            scenario.sensitivity(scenario.DEFAULT_SENSITIVITY_PCT, scenario.DEFAULT_SOLO_SHARE),
+            impact.base(),
+            impact.impact_table(),
+            workforce.projection_table(),
+        ),
+        "figures": lambda: [figures.get_figure(chart_id) for chart_id in figures.FIGURE_BUILDERS if figures.available(chart_id)],
+    }
+    timings = {}
+    for name, step in steps.items():
+        start = time.perf_counter()
+        step()
+        timings[name] = time.perf_counter() - start
+    return timings
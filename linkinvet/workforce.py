@@ -0,0 +1,114 @@
+# Projection de l'effectif vétérinaire (modèle par composantes de cohorte) — Scénario (estimation).
+#
+# État : tableau (jeux de paramètres, juridictions, sexe, âge) en années d'âge simples. Chaque année :
+#   1. sorties : attrition (tous âges) + retraite (à partir de l'âge de retraite), taux annuels ;
+#   2. vieillissement d'un an (sortie complète après MAX_AGE) ;
+#   3. entrées : diplômés à ENTRY_AGE, en % de l'effectif initial, répartis par sexe.
+# Tous les jeux de paramètres et toutes les juridictions avancent ensemble (une boucle sur les années) :
+# une projection complète sur 20 ans pour des centaines de jeux de paramètres prend quelques millisecondes.
+#
+# Effectif initial : vétérinaires actifs CVMA (2023-24). Répartition par sexe : OMVQ pour le Québec ;
+# hypothèse pour les autres juridictions (part observée au Québec). Répartition par âge : hypothèse
+# uniforme entre ENTRY_AGE et INITIAL_MAX_AGE (aucune source officielle agrégée par âge ici).
+
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from linkinvet.data import VETS_COLUMN, dataset_version, fact, get_df_ca
+
+BASE_YEAR = 2024
+ENTRY_AGE = 26
+MAX_AGE = 70
+INITIAL_MAX_AGE = 64
+AGES = np.arange(ENTRY_AGE, MAX_AGE + 1)
+SEXES = ("Femmes", "Hommes")
+
+# Hypothèses par défaut (curseurs de la vue Scénarios)
+DEFAULT_YEARS = 15
+DEFAULT_GRADUATES_PCT = 4.0       # diplômés par an, en % de l'effectif initial
+DEFAULT_FEMALE_SHARE_GRADS = 80.0 # part de femmes parmi les diplômés (%)
+DEFAULT_ATTRITION_PCT = 1.5       # départs annuels hors retraite (%)
+DEFAULT_RETIREMENT_AGE = 62
+DEFAULT_RETIREMENT_PCT = 20.0     # départs annuels à la retraite au-delà de l'âge de retraite (%)
+
+
+@lru_cache(maxsize=4)
+def _initial(version: str) -> tuple[tuple[str, ...], np.ndarray]:
+    """(juridictions, effectif initial (juridictions, sexe, âge))."""
+    df_ca = get_df_ca()
+    vets = df_ca[VETS_COLUMN].to_numpy(dtype=float)
+    female, male = fact("members_female", "QC"), fact("members_male", "QC")
+    female_share = np.full(len(df_ca), female / (female + male))
+    sex = np.stack([female_share, 1 - female_share], axis=1)
+    age = ((AGES >= ENTRY_AGE) & (AGES <= INITIAL_MAX_AGE)).astype(float)
+    age /= age.sum()
+    stock = vets[:, None, None] * sex[:, :, None] * age[None, None, :]
+    stock.flags.writeable = False
+    return tuple(df_ca["Juridiction"]), stock
+
+
+def project(
+    years: int = DEFAULT_YEARS,
+    graduates_pct=DEFAULT_GRADUATES_PCT,
+    female_share_grads=DEFAULT_FEMALE_SHARE_GRADS,
+    attrition_pct=DEFAULT_ATTRITION_PCT,
+    retirement_age=DEFAULT_RETIREMENT_AGE,
+    retirement_pct=DEFAULT_RETIREMENT_PCT,
+) -> np.ndarray:
+    """Effectifs projetés (jeux de paramètres, années 0..years, juridictions, sexe).
+
+    Les paramètres sont des scalaires ou des tableaux 1-D de même longueur (un jeu par élément).
+    """
+    _, stock0 = _initial(dataset_version())
+    graduates, female_grads, attrition, ret_age, ret_rate = np.broadcast_arrays(*(
+        np.atleast_1d(np.asarray(p, dtype=float))
+        for p in (graduates_pct, female_share_grads, attrition_pct, retirement_age, retirement_pct)
+    ))
+    # Pourcentages -> proportions
+    graduates, female_grads, attrition, ret_rate = graduates / 100, female_grads / 100, attrition / 100, ret_rate / 100
+
+    # Taux de sortie par jeu et par âge : (P, âge)
+    exit_rate = attrition[:, None] + (AGES[None, :] >= ret_age[:, None]) * ret_rate[:, None]
+    survival = np.clip(1 - exit_rate, 0, 1)[:, None, None, :]
+    # Entrées annuelles par jeu, juridiction et sexe : (P, J, S)
+    initial_total = stock0.sum(axis=(1, 2))
+    sex_split = np.stack([female_grads, 1 - female_grads], axis=1)
+    inflow = graduates[:, None, None] * initial_total[None, :, None] * sex_split[:, None, :]
+
+    stock = np.broadcast_to(stock0, (len(graduates), *stock0.shape)).copy()
+    out = np.empty((len(graduates), years + 1, *stock0.shape[:2]))
+    out[:, 0] = stock.sum(axis=-1)
+    for t in range(1, years + 1):
+        stock *= survival
+        stock[..., 1:] = stock[..., :-1].copy()
+        stock[..., 0] = inflow
+        out[:, t] = stock.sum(axis=-1)
+    return out
+
+
+@lru_cache(maxsize=64)
+def _projection_table(version: str, years: int, params: tuple) -> pd.DataFrame:
+    juris, _ = _initial(version)
+    result = project(years, *params)[0]  # (années, J, S)
+    n_years = years + 1
+    return pd.DataFrame({
+        "Juridiction": np.tile(np.repeat(juris, len(SEXES)), n_years),
+        "Année": np.repeat(BASE_YEAR + np.arange(n_years), len(juris) * len(SEXES)),
+        "Sexe": np.tile(SEXES, n_years * len(juris)),
+        "Effectif (estim.)": result.ravel(),
+    })
+
+
+def projection_table(
+    years: int = DEFAULT_YEARS,
+    graduates_pct: float = DEFAULT_GRADUATES_PCT,
+    female_share_grads: float = DEFAULT_FEMALE_SHARE_GRADS,
+    attrition_pct: float = DEFAULT_ATTRITION_PCT,
+    retirement_age: float = DEFAULT_RETIREMENT_AGE,
+    retirement_pct: float = DEFAULT_RETIREMENT_PCT,
+) -> pd.DataFrame:
+    """Table longue juridiction × année × sexe pour un jeu de paramètres — mise en cache, lecture seule."""
+    params = tuple(float(p) for p in (graduates_pct, female_share_grads, attrition_pct, retirement_age, retirement_pct))
+    return _projection_table(dataset_version(), int(years), params)
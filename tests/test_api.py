@@ -0,0 +1,46 @@
+import json
+import urllib.error
+import urllib.request
+
+import pytest
+
+from linkinvet import api
+
+
+def test_full_solo_share_serializes_undefined_ratio_as_null():
+    body = api.scenario_point({"juris": "QC", "solo_share": "100"})
+    assert body["Scénario"]["multi_ratio_est"] is None
+    json.dumps(body, allow_nan=False)
+
+
+@pytest.mark.parametrize("juris", ["CA", "XX"])
+def test_unknown_or_national_jurisdiction_is_a_bad_request(juris):
+    with pytest.raises(api.BadRequest):
+        api.scenario_point({"juris": juris})
+
+
+def test_out_of_range_parameter_is_a_bad_request():
+    with pytest.raises(api.BadRequest):
+        api.scenario_point({"solo_share": "150"})
+
+
+@pytest.fixture(scope="module")
+def base_url():
+    server = api.start_in_thread("127.0.0.1", 0)
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+def _get(url):
+    try:
+        with urllib.request.urlopen(url) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as exc:
+        return exc.code, json.loads(exc.read())
+
+
+def test_http_status_codes(base_url):
+    status, body = _get(f"{base_url}/v1/scenario?juris=QC&solo_share=100")
+    assert status == 200 and body["Scénario"]["multi_ratio_est"] is None
+    assert _get(f"{base_url}/v1/scenario?juris=CA")[0] == 400
+    assert _get(f"{base_url}/v1/nope")[0] == 404
@@ -0,0 +1,50 @@
+import pytest
+
+from linkinvet import dataset
+
+HEADER = "indicator,jurisdiction,period,source,value,status\n"
+
+
+@pytest.fixture
+def facts_dir(tmp_path, monkeypatch):
+    facts = tmp_path / "facts"
+    facts.mkdir()
+    monkeypatch.setattr(dataset, "FACTS_DIR", facts)
+    monkeypatch.setattr(dataset, "COMPILED_DIR", facts / "_compiled")
+    (facts / "base.csv").write_text(HEADER + "vets_active,QC,2023-24,CVMA,3212,Officiel\n", encoding="utf-8")
+    return facts
+
+
+def _csv(tmp_path, name, *rows):
+    path = tmp_path / name
+    path.write_text(HEADER + "".join(row + "\n" for row in rows), encoding="utf-8")
+    return path
+
+
+def test_ingest_adds_a_partition(tmp_path, facts_dir):
+    target = dataset.ingest(_csv(tmp_path, "new.csv", "vets_active,QC,2024-25,CVMA,3300,Officiel"), "cvma-2024-25")
+    assert target == facts_dir / "cvma-2024-25.csv"
+    assert dataset.load_facts(["period"]).column("period").to_pylist() == ["2023-24", "2024-25"]
+
+
+def test_ingest_rejects_duplicate_keys(tmp_path, facts_dir):
+    path = _csv(tmp_path, "dup.csv", "vets_active,ON,2024-25,CVMA,1,Officiel", "vets_active,ON,2024-25,CVMA,2,Officiel")
+    with pytest.raises(ValueError, match="double"):
+        dataset.ingest(path, "dup")
+
+
+def test_ingest_rejects_keys_of_another_partition(tmp_path, facts_dir):
+    with pytest.raises(ValueError, match="autre partition"):
+        dataset.ingest(_csv(tmp_path, "overlap.csv", "vets_active,QC,2023-24,CVMA,1,Officiel"), "overlap")
+
+
+def test_replace_refuses_to_drop_values(tmp_path, facts_dir):
+    path = _csv(tmp_path, "base.csv", "facilities_accredited,QC,2023-24,CVMA,942,Officiel")
+    with pytest.raises(FileExistsError):
+        dataset.ingest(path, "base")
+    with pytest.raises(ValueError, match="retirerait"):
+        dataset.ingest(path, "base", replace=True)
+
+    kept = _csv(tmp_path, "base2.csv", "vets_active,QC,2023-24,CVMA,3213,Officiel", "facilities_accredited,QC,2023-24,CVMA,942,Officiel")
+    dataset.ingest(kept, "base", replace=True)
+    assert len(dataset.load_facts(["value"])) == 2
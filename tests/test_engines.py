@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from linkinvet import access, geo, impact, workforce
+from linkinvet.data import fact
+
+
+@pytest.mark.parametrize("measure, direct, total", [
+    ("output", "output_direct_mcad", "output_total_mcad"),
+    ("gdp", "gdp_direct_mcad", "gdp_total_mcad"),
+    ("employment", "employment_direct_fte", "employment_total_fte"),
+])
+def test_impact_sums_back_to_table1(measure, direct, total):
+    res = impact.evaluate()
+    j = list(impact.MEASURES).index(measure)
+    assert res["direct"][:, j].sum() == pytest.approx(fact(direct, "CA", "2023-24"))
+    assert res["total"][:, j].sum() == pytest.approx(fact(total, "CA", "2023-24"))
+
+
+def test_impact_shocks_broadcast():
+    shocks = np.stack([np.zeros(3), np.full(3, 10.0)])[:, None, :]
+    res = impact.evaluate(shocks)
+    np.testing.assert_allclose(res["total"][1], res["total"][0] * 1.1)
+
+
+def test_workforce_stock_unchanged_without_flows():
+    # Pas d'entrées ni de sorties ; horizon assez court pour que personne ne dépasse MAX_AGE
+    years = workforce.MAX_AGE - workforce.INITIAL_MAX_AGE
+    out = workforce.project(years, graduates_pct=0, attrition_pct=0, retirement_pct=0)
+    np.testing.assert_allclose(out[0].sum(axis=-1), out[0, :1].sum(axis=-1).repeat(years + 1, axis=0))
+
+
+def test_workforce_parameter_sets_are_independent():
+    batch = workforce.project(10, graduates_pct=[0.0, 4.0])
+    np.testing.assert_allclose(batch[1], workforce.project(10, graduates_pct=4.0)[0])
+    assert batch[1, -1].sum() > batch[0, -1].sum()
+
+
+def test_simplify_line_drops_collinear_points():
+    line = np.array([[0, 0], [1, 0.001], [2, 0], [3, 0], [3, 3]], dtype=float)
+    np.testing.assert_array_equal(geo.simplify_line(line, 0.01), [[0, 0], [3, 0], [3, 3]])
+    np.testing.assert_array_equal(geo.simplify_line(line, 0), line)
+
+
+def test_chord_distance_round_trip():
+    km = np.array([0.0, 25.0, 100.0, 1_000.0])
+    np.testing.assert_allclose(access.chord_to_km(access.km_to_chord(km)), km, atol=1e-9)
+    # Équateur -> pôle : un quart de méridien
+    points = access.unit_vectors([0, 90], [0, 0])
+    chord = np.linalg.norm(points[0] - points[1])
+    assert access.chord_to_km(chord) == pytest.approx(np.pi / 2 * access.EARTH_RADIUS_KM)
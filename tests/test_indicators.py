@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+
+from linkinvet.indicators import REGISTRY, Evaluator, Registry
+
+
+def _registry():
+    registry = Registry()
+
+    @registry.derived("ratio", "vets", "facs")
+    def _(vets, facs):
+        return vets / facs
+
+    @registry.derived("per_10k", "vets", "population")
+    def _(vets, population):
+        return vets / population * 10_000
+
+    @registry.derived("ratio_x2", "ratio")
+    def _(ratio):
+        return ratio * 2
+
+    return registry
+
+
+SOURCES = {"vets": np.array([10.0, 20.0]), "facs": np.array([5.0, 4.0]), "population": np.array([1e4, 2e4])}
+
+
+def test_first_evaluation_computes_every_node():
+    evaluator = Evaluator(_registry())
+    values = evaluator.evaluate(SOURCES)
+    assert sorted(evaluator.last_recomputed) == ["per_10k", "ratio", "ratio_x2"]
+    np.testing.assert_allclose(values["ratio_x2"], [4.0, 10.0])
+
+
+def test_unchanged_sources_recompute_nothing():
+    evaluator = Evaluator(_registry())
+    evaluator.evaluate(SOURCES)
+    evaluator.evaluate({name: value.copy() for name, value in SOURCES.items()})
+    assert evaluator.last_recomputed == []
+
+
+def test_only_dependents_of_a_changed_source_are_recomputed():
+    evaluator = Evaluator(_registry())
+    evaluator.evaluate(SOURCES)
+    values = evaluator.evaluate({**SOURCES, "population": np.array([2e4, 2e4])})
+    assert evaluator.last_recomputed == ["per_10k"]
+    np.testing.assert_allclose(values["per_10k"], [5.0, 10.0])
+
+    evaluator.evaluate({**SOURCES, "population": np.array([2e4, 2e4]), "facs": np.array([10.0, 4.0])})
+    assert sorted(evaluator.last_recomputed) == ["ratio", "ratio_x2"]
+
+
+def test_unchanged_intermediate_value_stops_propagation():
+    evaluator = Evaluator(_registry())
+    evaluator.evaluate(SOURCES)
+    # vets et facs doublés : ratio identique, ratio_x2 n'est pas recalculé
+    evaluator.evaluate({**SOURCES, "vets": SOURCES["vets"] * 2, "facs": SOURCES["facs"] * 2})
+    assert sorted(evaluator.last_recomputed) == ["per_10k", "ratio"]
+
+
+def test_values_are_read_only():
+    values = Evaluator(_registry()).evaluate(SOURCES)
+    with pytest.raises(ValueError):
+        values["ratio"][0] = 0
+
+
+def test_missing_source_and_cycle_are_rejected():
+    with pytest.raises(ValueError, match="population"):
+        Evaluator(_registry()).evaluate({"vets": SOURCES["vets"], "facs": SOURCES["facs"]})
+
+    registry = Registry()
+    registry.derived("a", "b")(lambda b: b)
+    registry.derived("b", "a")(lambda a: a)
+    with pytest.raises(ValueError, match="cycle"):
+        registry.order()
+
+
+def test_dashboard_registry_is_acyclic():
+    assert {node.name for node in REGISTRY.order()} >= {"can_ratio", "prov_vets_per_10k", "can_tax_per_gdp"}
@@ -0,0 +1,22 @@
+from linkinvet.pdf_ingest import NUM_RE, PROVINCE_CODES, parse_cvma_province_figure, parse_number
+
+# Étiquettes de la Figure 1 du rapport CVMA, telles qu'extraites par pdfplumber
+FIGURE1_LINE = "5386 3212 2099 2141 724 495 458 167 238 158 34 4"
+FIGURE1_VALUES = [5386, 3212, 2099, 2141, 724, 495, 458, 167, 238, 158, 34, 4]
+
+
+def test_space_is_not_a_thousands_separator():
+    assert [parse_number(n) for n in NUM_RE.findall(FIGURE1_LINE)] == FIGURE1_VALUES
+
+
+def test_thousands_separators():
+    assert [parse_number(n) for n in NUM_RE.findall("1,234.5 ; 1\u00a0234,5 ; 12\u202f345")] == [1234.5, 1234.5, 12345]
+
+
+def test_province_figure_text_fallback():
+    page = {
+        "page": 1,
+        "text": "Figure 1 Active veterinarians by province\n" + " ".join(PROVINCE_CODES) + "\n" + FIGURE1_LINE + "\n",
+        "tables": [],
+    }
+    assert parse_cvma_province_figure([page], 1) == dict(zip(PROVINCE_CODES, FIGURE1_VALUES))
@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+from linkinvet import scenario
+from linkinvet.data import FACILITIES_COLUMN, VETS_COLUMN, get_df_ca
+
+
+def test_solve_splits_facilities_and_vets():
+    res = scenario.solve(100, 40, 25, 1.0)
+    assert res["solo_facilities"] == pytest.approx(10)
+    assert res["multi_facilities"] == pytest.approx(30)
+    assert res["solo_vets_est"] == pytest.approx(10)
+    assert res["multi_vets_est"] == pytest.approx(90)
+    assert res["multi_ratio_est"] == pytest.approx(3)
+
+
+def test_solve_ratio_is_nan_without_multi_facilities():
+    assert np.isnan(scenario.solve(100, 40, 100)["multi_ratio_est"])
+
+
+def test_grid_matches_point_evaluation():
+    grid = scenario.scenario_grid()
+    row = grid[(grid["Juridiction"] == scenario.DEFAULT_JURIS) & (grid["Part solo (%)"] == 40)].iloc[0]
+    point = scenario.scenario_point(scenario.DEFAULT_JURIS, 40)
+    assert row["Vétérinaires en structure multi (estim.)"] == pytest.approx(point["multi_vets_est"])
+
+
+def test_sensitivity_shape_and_base():
+    df_ca = get_df_ca()
+    table = scenario.sensitivity(20, 30)
+    assert len(table) == len(scenario.SENSITIVITY_OUTPUTS) * len(df_ca) * len(scenario.SENSITIVITY_INPUTS)
+
+    qc = df_ca[df_ca["Juridiction"] == scenario.DEFAULT_JURIS].iloc[0]
+    base = scenario.solve(qc[VETS_COLUMN], qc[FACILITIES_COLUMN], 30)["multi_vets_est"]
+    rows = table[(table["Juridiction"] == scenario.DEFAULT_JURIS)
+                 & (table["Indicateur"] == scenario.SENSITIVITY_OUTPUTS["multi_vets_est"])]
+    np.testing.assert_allclose(rows["Base"], base)
+    assert (rows["Amplitude"] == (rows["Haut"] - rows["Bas"]).abs()).all()
+
+
+def test_sensitivity_solo_share_is_perturbed_additively():
+    table = scenario.sensitivity(10, 0)
+    label = scenario.SENSITIVITY_INPUTS["solo_share"]
+    rows = table[(table["Hypothèse"] == label)
+                 & (table["Indicateur"] == scenario.SENSITIVITY_OUTPUTS["solo_vets_est"])]
+    # Part solo de 0 % : -10 points bornés à 0, +10 points -> amplitude non nulle
+    assert (rows["Bas"] == 0).all()
+    assert (rows["Amplitude"] > 0).all()
+
+
+def test_monte_carlo_percentiles_are_ordered_and_reproducible():
+    dist_share = scenario.Distribution("triangulaire", 10, 20, 40)
+    dist_vps = scenario.Distribution("uniforme", 1.0, 1.0, 1.5)
+    result = scenario.monte_carlo(dist_share, dist_vps, n_draws=20_000, seed=1)
+    columns = [f"P{p}" for p in scenario.MC_PERCENTILES]
+    values = result.percentiles[columns].to_numpy()
+    assert (np.diff(values, axis=1) >= 0).all()
+
+    again = scenario._monte_carlo.__wrapped__("v", dist_share, dist_vps, 20_000, 1)
+    np.testing.assert_allclose(again.percentiles[columns].to_numpy(), values)
+
+    edges, counts = result.histograms[(scenario.DEFAULT_JURIS, "solo_vets_est")]
+    assert len(edges) == len(counts) + 1 == scenario.MC_HIST_BINS + 1
+    assert counts.sum() == 20_000
+
+
+def test_monte_carlo_degenerate_distributions_match_solve():
+    point = scenario.Distribution("triangulaire", 20, 20, 20)
+    one = scenario.Distribution("triangulaire", 1.0, 1.0, 1.0)
+    table = scenario.monte_carlo(point, one, n_draws=1_000).percentiles
+    row = table[(table["Juridiction"] == scenario.DEFAULT_JURIS)
+                & (table["Indicateur"] == scenario.MC_OUTPUTS["multi_vets_est"])].iloc[0]
+    expected = scenario.scenario_point(scenario.DEFAULT_JURIS, 20)["multi_vets_est"]
+    assert row["P5"] == pytest.approx(expected)
+    assert row["P95"] == pytest.approx(expected)